@@ -10,12 +10,14 @@ async def main() -> None:
     client = FastdfsClient(["dfs.waketzheng.top"])
 
     p = Path(__file__)
-    url = await client.upload(p.read_bytes(), p.suffix)
-    print(f"{url = }")
-    # url = 'https://dfs.waketzheng.top/group1/M00/00/00/eE0vIWZ1IXCAdnE5AAAIuzDpzQ46480.py'
-
-    if "--save" not in sys.argv:
-        r = await client.delete(url)
+    if "--save" in sys.argv:
+        url = await client.upload(p.read_bytes(), p.suffix)
+        print(f"{url = }")
+        # url = 'https://dfs.waketzheng.top/group1/M00/00/00/eE0vIWZ1IXCAdnE5AAAIuzDpzQ46480.py'
+    else:
+        # upload+delete in one shot: a single tracker query for both ops
+        url, r = await client.upload_and_delete(p.read_bytes(), p.suffix)
+        print(f"{url = }")
         print(r)
 
 
@@ -0,0 +1,22 @@
+#!/usr/bin/env python
+import asyncio
+import sys
+from pathlib import Path
+
+from fastdfs_client import FastdfsClient
+
+
+async def main() -> None:
+    client = FastdfsClient(["dfs.waketzheng.top"])
+
+    paths = [Path(__file__), Path(__file__).parent.parent / "README.md"]
+    urls = await client.upload_many([(p.read_bytes(), p.suffix) for p in paths])
+    print(f"{urls = }")
+
+    if "--save" not in sys.argv:
+        for r in await client.delete_many(urls):
+            print(r)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -13,6 +13,6 @@ print(f"{url = }")
 if "--save" in sys.argv:
     sys.exit()
 
-file_id = url.split("://")[-1].split("/", 1)[-1]
+file_id = FastdfsClient.file_id_from_url(url)
 r = client.delete_file(file_id)
 print(r)
@@ -1,11 +1,72 @@
-from .client import AsyncDfsClient, FastdfsClient
+import os as _os
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .client import AsyncDfsClient, FastdfsClient
+    from .connection import PoolConfig
+
+if _os.getenv("FASTDFS_USE_UVLOOP") == "1":  # speed up asyncio socket I/O
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        uvloop.install()
 
 __version__ = "1.2.2"
-VERSION = tuple(map(int, __version__.split(".")))
+
+# PEP 562 lazy re-exports: the submodule import graph is loaded on first
+# attribute access, keeping `import fastdfs_client` itself nearly free
+_lazy_imports = {
+    "FastdfsClient": ".client",
+    "AsyncDfsClient": ".client",
+    "PoolConfig": ".connection",
+}
+
+
+def __getattr__(name: str):
+    if name == "VERSION":
+        value = globals()["VERSION"] = tuple(map(int, __version__.split(".")))
+        return value
+    if module_name := _lazy_imports.get(name):
+        from importlib import import_module
+
+        value = globals()[name] = getattr(import_module(module_name, __name__), name)
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def install_uvloop() -> bool:
+    """Install uvloop as the asyncio event loop policy, if available.
+
+    Call this before `asyncio.run` to speed up the async client's socket
+    I/O; same effect as setting `FASTDFS_USE_UVLOOP=1` in the environment.
+    Returns True when uvloop was installed, False when it is not importable.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    uvloop.install()
+    return True
+
+
+def get_version() -> str:
+    """Look up the installed distribution version at runtime.
+
+    Import-time code should read the `__version__` literal instead, which
+    avoids scanning site-packages metadata.
+    """
+    from importlib.metadata import version
+
+    return version("fastdfs-client")
 
 
 __all__ = (
     "VERSION",
     "FastdfsClient",
     "AsyncDfsClient",
+    "PoolConfig",
+    "get_version",
+    "install_uvloop",
 )
@@ -1,26 +1,77 @@
 from __future__ import annotations
 
-import contextlib
+import mmap
 import os
 import random
-import re
 import socket
-from functools import cached_property
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Annotated, Type, TypedDict, Union, cast, get_type_hints
 
-from .connection import ConnectionPool
-from .exceptions import ConfigError, DataError, ResponseError
-from .protols import STORAGE_SET_METADATA_FLAG_OVERWRITE
+from .connection import ConnectionPool, PoolConfig
+from .exceptions import ConfigError, ConnectionError, DataError
+from .protols import (
+    STORAGE_SET_METADATA_FLAG_OVERWRITE,
+    TRACKER_PROTO_CMD_SERVICE_QUERY_FETCH_ONE,
+    StorageServer,
+)
 from .storage_client import StorageClient
 from .tracker_client import TrackerClient
 from .utils import FastdfsConfigParser, fdfs_check_file, logger, split_remote_fileid
 
-RE_IP = re.compile(r"(?:[0-9]{1,3}\.){3}[0-9]{1,3}$")
+try:
+    import anyio
+except ImportError:
+    anyio = None  # type:ignore[assignment]
+
+DOMAIN_IP_TTL = 60  # seconds a resolved domain IP is reused before a fresh lookup
+UPDATE_SERV_TTL = 60  # seconds a tracker's update-storage answer is reused
+ROUTE_TTL = 30  # seconds an async tracker routing answer is reused
+MMAP_THRESHOLD = 64 * 1024  # files above this are mmap-ed instead of read into bytes
+STORE_IDLE_TIMEOUT = 300  # seconds an unused per-server StorageClient is kept
+_domain_ip_cache: dict[str, tuple[float, str]] = {}
+
+
+def _as_int(value, default=0) -> int:
+    """Coerce an offset-like value to int, falling back to ``default``."""
+    if type(value) is int:
+        return value
+    if not value:
+        return default
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _destroy_pools(storage_clients: dict, tracker_pool: ConnectionPool) -> None:
+    # Module-level so weakref.finalize can run it after the client is gone
+    # without keeping the client itself alive
+    for store in storage_clients.values():
+        try:
+            store.pool.destroy()
+        except Exception as e:
+            logger.debug(f"Failed to destroy: {e}")
+    try:
+        tracker_pool.destroy()
+    except Exception as e:
+        logger.debug(f"Failed to destroy: {e}")
 
 
 def is_IPv4(value: str) -> bool:
-    return RE_IP.match(value) is not None
+    # Host classification runs for every tracker entry on every upload/delete;
+    # inet_aton is a single C-level parse, far cheaper than a regex. The dot
+    # count rules out the short forms ('127.1') that inet_aton also accepts.
+    if value.count(".") != 3:
+        return False
+    try:
+        socket.inet_aton(value)
+    except OSError:
+        return False
+    return True
 
 
 class ConfigDict(TypedDict):
@@ -32,6 +83,11 @@ class ConfigDict(TypedDict):
     name: str
 
 
+# Resolved once at import; get_type_hints walks and evaluates annotations on
+# every call, which is needless work for a plain key-presence check
+_CONFIG_KEYS: frozenset[str] = frozenset(ConfigDict.__annotations__)
+
+
 class Config:
     port = 22122
     timeout = 30
@@ -44,8 +100,26 @@ class Config:
         port: int | None = None,
         timeout: int | None = None,
     ) -> ConfigDict:
+        ips = []
+        for host in hosts:
+            # Accept 'ip:port' entries so the tuple form never needs a conf file.
+            # All hosts share one port, so differing ':port' values conflict.
+            if ":" in host:
+                host, _, host_port = host.rpartition(":")
+                try:
+                    host_port = int(host_port)
+                except ValueError as e:
+                    raise ConfigError(
+                        f"Invalid port in tracker host: {host}:{host_port}"
+                    ) from e
+                if port is not None and host_port != port:
+                    raise ConfigError(
+                        f"Conflicting tracker ports: {port} and {host_port}"
+                    )
+                port = host_port
+            ips.append(host)
         return {
-            "host_tuple": hosts,
+            "host_tuple": tuple(ips),
             "port": port or cls.port,
             "timeout": timeout or cls.timeout,
             "name": cls.name,
@@ -53,6 +127,19 @@ class Config:
 
 
 def get_tracker_conf(conf_path="client.conf") -> dict:
+    """Parse a tracker conf file; repeated reads of an unchanged file are cached."""
+    try:
+        mtime = os.stat(conf_path).st_mtime
+    except OSError as e:
+        raise ConfigError(str(e)) from e
+    # the cached dict is copied so callers can't mutate the shared entry
+    return _parse_tracker_conf(str(conf_path), mtime).copy()
+
+
+@lru_cache(maxsize=32)
+def _parse_tracker_conf(conf_path: str, mtime: float) -> dict:
+    # mtime is part of the key purely to invalidate the cache when the
+    # file changes on disk
     cf = FastdfsConfigParser()
     tracker: dict = {}
     try:
@@ -94,20 +181,39 @@ class BaseClient:
         if isinstance(trackers, (str, Path)):
             trackers = get_tracker_conf(str(trackers))
         elif isinstance(trackers, (tuple, list)):
-            trackers = Config.create(tuple(trackers))
+            if not isinstance(trackers, tuple):  # skip the copy for tuples
+                trackers = tuple(trackers)
+            trackers = Config.create(trackers)
         elif isinstance(trackers, dict):
             self._check_config(trackers)
         self.trackers = cast(dict, trackers)
         self.timeout = self.trackers["timeout"]
         self.ip_mapping = ip_mapping
         self.ssl = ssl
+        self._scheme = "https://" if ssl else "http://"
+        self._host_cache: dict[str, str] = {}  # storage_ip -> URL prefix
+        # domain -> ip, one pass at construction (ip_mapping is frozen anyway)
+        self.domain_ip: dict[str, str] = (
+            {v.rsplit("://", 1)[-1]: k for k, v in ip_mapping.items()}
+            if ip_mapping
+            else {}
+        )
 
     def _check_config(self, trackers) -> None:
-        expected = get_type_hints(ConfigDict)
-        if missing := set(expected) - set(trackers):
+        if missing := _CONFIG_KEYS - trackers.keys():
+            expected = get_type_hints(ConfigDict)
             raise ConfigError(f"Invalid trackers: {missing=} (expected: {expected})")
 
     def _build_host(self, storage_ip: str) -> str:
+        # Cached per storage IP; mutating self.ip_mapping after construction
+        # is not supported and would leave stale entries here
+        if host := self._host_cache.get(storage_ip):
+            return host
+        host = self._resolve_host(storage_ip)
+        self._host_cache[storage_ip] = host
+        return host
+
+    def _resolve_host(self, storage_ip: str) -> str:
         ip_mapping = self.ip_mapping or {}
         if storage_ip not in ip_mapping:
             listed_domains = ip_mapping.values()
@@ -120,35 +226,158 @@ class BaseClient:
         if h := ip_mapping.get(storage_ip):
             if not h.endswith("/"):
                 h += "/"
-            if not h.startswith("http"):
-                scheme = "https" if self.ssl else "http"
-                h = f"{scheme}://" + h
+            if not h.startswith(("http://", "https://")):
+                h = self._scheme + h
             return h
         return f"http://{storage_ip}/"
 
+    @staticmethod
+    def file_id_from_url(url: str) -> str:
+        """Extract the remote file id from an upload URL in a single pass.
+
+        https://example.com/group1/M00/00/00/xxx.jpg -> group1/M00/00/00/xxx.jpg
+        """
+        i = url.find("://")
+        if i < 0:  # already a file id
+            return url
+        j = url.find("/", i + 3)
+        return url[j + 1 :]
+
     @staticmethod
     def get_domain_ip(domain: str) -> str:
-        """Get domain IP by socket: github.com -> 140.82.113.3"""
-        return socket.gethostbyname(domain)
+        """Get domain IP by socket: github.com -> 140.82.113.3
 
+        Results are cached for `DOMAIN_IP_TTL` seconds, so back-to-back
+        calls (e.g.: a delete right after an upload) skip the DNS roundtrip.
+        """
+        now = time.monotonic()
+        if cached := _domain_ip_cache.get(domain):
+            ts, ip = cached
+            if now - ts < DOMAIN_IP_TTL:
+                return ip
+        ip = socket.gethostbyname(domain)
+        _domain_ip_cache[domain] = (now, ip)
+        return ip
 
-class AsyncDfsClient(BaseClient):
-    @cached_property
-    def domain_ip(self) -> dict[str, str]:
-        return {v.split("://")[-1]: k for k, v in (self.ip_mapping or {}).items()}
 
-    def random_host(self) -> tuple[str, int]:
-        ip_list: list[str] = []
+class AsyncDfsClient(BaseClient):
+    _preferred_host: tuple[str, int] | None = None
+    _resolved_hosts: tuple[tuple[str, int], ...] = ()
+    _resolved_at = 0.0
+    _static_hosts = False  # True when host_tuple is all IPs, so no TTL needed
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._route_cache: dict[
+            tuple[str, str, int | None], tuple[float, StorageServer]
+        ] = {}
+
+    def tracker_hosts(self) -> tuple[tuple[str, int], ...]:
+        now = time.monotonic()
+        if self._resolved_hosts and (
+            self._static_hosts or now - self._resolved_at < DOMAIN_IP_TTL
+        ):
+            return self._resolved_hosts
+        port = self.trackers["port"]
+        hosts: list[tuple[str, int]] = []
+        static = True
         for host in self.trackers["host_tuple"]:
             if not is_IPv4(host):
+                static = False
                 if host in self.domain_ip:
                     host = self.domain_ip[host]
                 else:
                     host = self.get_domain_ip(host)
-            ip_list.append(host)
-        if len(ip_list) > 1:
-            host = random.choice(ip_list)
-        return host, self.trackers["port"]
+            hosts.append((host, port))
+        self._resolved_hosts = tuple(hosts)
+        self._resolved_at = now
+        self._static_hosts = static
+        return self._resolved_hosts
+
+    def random_host(self) -> tuple[str, int]:
+        hosts = self.tracker_hosts()
+        if len(hosts) == 1:
+            return hosts[0]
+        return random.choice(hosts)
+
+    async def aclose(self) -> None:
+        """Drop cached tracker routing state.
+
+        Connections are opened per call and closed by their own context
+        managers, so there are no pooled sockets to release here.
+        """
+        self._preferred_host = None
+        self._resolved_hosts = ()
+        self._resolved_at = 0.0
+        self._route_cache.clear()
+
+    async def __aenter__(self) -> "AsyncDfsClient":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
+    async def _get_storage_server(
+        self, group_name="", filename="", cmd: int | None = None
+    ) -> StorageServer:
+        """Query trackers for a storage server, fanning out to all of them.
+
+        The first successful response wins and its tracker is remembered,
+        so follow-up calls skip the fan-out until that tracker fails.
+        The answer itself is also reused for `ROUTE_TTL` seconds, so a batch
+        of uploads or modifies against the same group pays one tracker
+        round-trip instead of N.
+        """
+        route_key = (group_name, filename, cmd)
+        now = time.monotonic()
+        if cached := self._route_cache.get(route_key):
+            ts, store_serv = cached
+            if now - ts < ROUTE_TTL:
+                return store_serv
+        store_serv = await self._query_storage_server(group_name, filename, cmd)
+        self._route_cache[route_key] = (now, store_serv)
+        return store_serv
+
+    def _drop_routes(self) -> None:
+        """Forget cached routing answers, e.g. after a storage error."""
+        self._route_cache.clear()
+
+    async def _query_storage_server(
+        self, group_name="", filename="", cmd: int | None = None
+    ) -> StorageServer:
+        if (preferred := self._preferred_host) is not None:
+            try:
+                return await TrackerClient.get_storage_server(
+                    preferred, group_name, filename, cmd
+                )
+            except Exception as e:
+                logger.debug(f"Preferred tracker {preferred} failed: {e}")
+                self._preferred_host = None
+        hosts = self.tracker_hosts()
+        if len(hosts) == 1 or anyio is None:
+            return await TrackerClient.get_storage_server(
+                hosts[0], group_name, filename, cmd
+            )
+        winners: list[tuple[tuple[str, int], StorageServer]] = []
+
+        async def query(host: tuple[str, int]) -> None:
+            try:
+                store_serv = await TrackerClient.get_storage_server(
+                    host, group_name, filename, cmd
+                )
+            except Exception as e:
+                logger.debug(f"Tracker {host} failed: {e}")
+            else:
+                winners.append((host, store_serv))
+                tg.cancel_scope.cancel()
+
+        async with anyio.create_task_group() as tg:
+            for host in hosts:
+                tg.start_soon(query, host)
+        if not winners:
+            raise ConnectionError("[-] Error: no tracker responded: %s" % (hosts,))
+        self._preferred_host, store_serv = winners[0]
+        return store_serv
 
     async def upload(self, content: bytes, suffix=".jpg") -> str:
         """Upload file content, if success return a URL
@@ -167,12 +396,219 @@ class AsyncDfsClient(BaseClient):
         # https://example.com/group1/M00/00/00/eE0vIWZEgMCAFnaMAAABXbxaFk89563.jpeg
         ```
         """
-        store_serv = await TrackerClient.get_storage_server(self.random_host())
+        store_serv = await self._get_storage_server()
         store = StorageClient(store_serv.ip_addr, store_serv.port, self.timeout)  # type:ignore
-        res = await store.upload_buffer(store_serv, content, suffix.lstrip("."))
+        try:
+            res = await store.upload_buffer(store_serv, content, suffix.lstrip("."))
+        except Exception:
+            self._drop_routes()
+            raise
         uri_path = res["Remote file_id"]  # 'group1/M00/00/00/eE..R458.jpg'
         return self._build_host(res["Storage IP"]) + uri_path
 
+    async def upload_path(self, path: str | Path, suffix: str | None = None) -> str:
+        """Upload a local file by its path, if success return a URL
+
+        Files larger than `MMAP_THRESHOLD` are mapped into memory instead of
+        being read into a bytes object, so peak RSS stays near zero extra
+        instead of doubling the file size.
+
+        :param path: path of the local file
+        :param suffix: defaults to the path's suffix
+        """
+        p = Path(path)
+        if suffix is None:
+            suffix = p.suffix
+        if p.stat().st_size > MMAP_THRESHOLD:
+            with open(p, "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # asyncio's transport.write only takes bytes-like data, so
+                    # expose the mapping through a memoryview; release it before
+                    # the mmap closes or close() raises BufferError
+                    view = memoryview(mm)
+                    try:
+                        return await self.upload(view, suffix)  # type:ignore[arg-type]
+                    finally:
+                        view.release()
+        return await self.upload(p.read_bytes(), suffix)
+
+    async def upload_and_delete(
+        self, content: bytes, suffix=".jpg"
+    ) -> tuple[str, tuple]:
+        """Upload file content then delete it right away, sharing one tracker query
+
+        Useful for connectivity self-tests: the delete reuses the storage
+        server returned for the upload, so only one tracker round-trip and
+        one DNS lookup are paid instead of two.
+
+        :param content: bytes type of file content
+        :param suffix: this will add at the end of URL with a dot before it
+        :return: (url, delete_result) tuple
+        """
+        store_serv = await self._get_storage_server()
+        store = StorageClient(store_serv.ip_addr, store_serv.port, self.timeout)  # type:ignore
+        res = await store.upload_buffer(store_serv, content, suffix.lstrip("."))
+        uri_path = res["Remote file_id"]
+        url = self._build_host(res["Storage IP"]) + uri_path
+        _, remote_filename = cast("tuple[str, str]", split_remote_fileid(uri_path))
+        ret = await store.delete_file(store_serv, remote_filename)
+        return url, ret
+
+    async def download_to_file(
+        self,
+        local_filename: str | Path,
+        file: Annotated[str, "remote_file id or URL, e.g.: group1/M00/00/xxx.jpg"],
+    ) -> dict:
+        """Download a remote file to a local one, if success return a dict
+
+        The file is written through a worker thread, so the event loop stays
+        free to receive the next chunk while the previous one hits the disk.
+
+        :param local_filename: path to save the downloaded content to
+        :param file: remote file id or URL
+        :return: dict -- {'Remote file_id': ..., 'Content': ..., 'Download size': ..., 'Storage IP': ...}
+        """
+        if not (tmp := split_remote_fileid(self.file_id_from_url(file))):
+            raise DataError("[-] Error: remote_file_id is invalid.(in download file)")
+        group_name, remote_filename = tmp
+        store_serv = await self._get_storage_server(
+            group_name, remote_filename, TRACKER_PROTO_CMD_SERVICE_QUERY_FETCH_ONE
+        )
+        store = StorageClient(store_serv.ip_addr, store_serv.port, self.timeout)
+        return await store.download_file(
+            store_serv, remote_filename, str(local_filename)
+        )
+
+    async def modify_by_buffer(
+        self,
+        filebuffer: bytes,
+        appender_fileid: Annotated[str, "remote_file id or URL of an appender file"],
+        offset=0,
+    ) -> dict:
+        """Modify an uploaded appender file, if success return a dict
+
+        :param filebuffer: bytes to write at ``offset``
+        :param appender_fileid: remote file id or URL of the appender file
+        :param offset: position in the remote file to write at
+        :return: dict -- {'Status': ..., 'Storage IP': ...}
+        """
+        if not filebuffer:
+            raise DataError("[-] Error: filebuffer can not be null.(modify)")
+        if not (tmp := split_remote_fileid(self.file_id_from_url(appender_fileid))):
+            raise DataError("[-] Error: remote_fileid is invalid.(modify)")
+        group_name, appender_filename = tmp
+        store_serv = await self._get_storage_server(group_name, appender_filename)
+        store = StorageClient(store_serv.ip_addr, store_serv.port, self.timeout)  # type:ignore
+        try:
+            return await store.modify_buffer(
+                store_serv, appender_filename, filebuffer, int(offset or 0)
+            )
+        except Exception:
+            self._drop_routes()
+            raise
+
+    async def modify_by_filename(
+        self, filename: str | Path, appender_fileid: str, offset=0
+    ) -> dict:
+        """Modify an uploaded appender file with a local file's content
+
+        The local file is read through a worker thread, so the event loop
+        is not blocked while it comes off the disk.
+        """
+        async with await anyio.open_file(filename, "rb") as f:
+            content = await f.read()
+        return await self.modify_by_buffer(content, appender_fileid, offset)
+
+    async def upload_many(
+        self, items: list[tuple[bytes, str]], concurrency: int = 16
+    ) -> list[str]:
+        """Upload several files concurrently, if success return list of URLs
+
+        A single tracker query is issued for the whole batch, then the
+        uploads run concurrently against the chosen storage server, with at
+        most ``concurrency`` of them in flight so a huge batch can't flood
+        the storage node with connections.
+
+        :param items: list of (content, suffix) pairs
+        :param concurrency: max uploads in flight at once
+        :return: URLs in the same order as ``items``
+
+        Example::
+        ```py
+        from pathlib import Path
+        from fastdfs_client import AsyncDfsClient
+
+        client = AsyncDfsClient(['example.com'])
+        files = [Path('a.jpg'), Path('b.jpg')]
+        urls = await client.upload_many([(p.read_bytes(), p.suffix) for p in files])
+        ```
+        """
+        store_serv = await self._get_storage_server()
+        store = StorageClient(store_serv.ip_addr, store_serv.port, self.timeout)  # type:ignore
+        urls: list = [None] * len(items)
+        limiter = anyio.Semaphore(concurrency)
+
+        async def _upload(index: int, content: bytes, suffix: str) -> None:
+            async with limiter:
+                res = await store.upload_buffer(store_serv, content, suffix.lstrip("."))
+            urls[index] = self._build_host(res["Storage IP"]) + res["Remote file_id"]
+
+        async with anyio.create_task_group() as tg:
+            for i, (content, suffix) in enumerate(items):
+                tg.start_soon(_upload, i, content, suffix)
+        return cast("list[str]", urls)
+
+    async def upload_paths(
+        self, paths: list[str | Path], concurrency: int = 16
+    ) -> list[str]:
+        """Upload several local files concurrently, if success return list of URLs
+
+        Like `upload_many` but reading from disk: one tracker query covers
+        the whole batch, and each file is read through a worker thread so
+        the event loop keeps sending one file while the next comes off the
+        disk.
+
+        :param paths: local file paths; each URL keeps its path's suffix
+        :param concurrency: max uploads in flight at once
+        :return: URLs in the same order as ``paths``
+        """
+        store_serv = await self._get_storage_server()
+        store = StorageClient(store_serv.ip_addr, store_serv.port, self.timeout)  # type:ignore
+        urls: list = [None] * len(paths)
+        limiter = anyio.Semaphore(concurrency)
+
+        async def _upload(index: int, path: Path) -> None:
+            async with limiter:
+                async with await anyio.open_file(path, "rb") as f:
+                    content = await f.read()
+                res = await store.upload_buffer(
+                    store_serv, content, path.suffix.lstrip(".")
+                )
+            urls[index] = self._build_host(res["Storage IP"]) + res["Remote file_id"]
+
+        async with anyio.create_task_group() as tg:
+            for i, path in enumerate(paths):
+                tg.start_soon(_upload, i, Path(path))
+        return cast("list[str]", urls)
+
+    async def delete_many(
+        self, files: list[Annotated[str, "remote_file ids or URLs"]]
+    ) -> list[tuple]:
+        """Delete several uploaded files concurrently
+
+        :param files: list of remote file ids or URLs
+        :return: result tuples in the same order as ``files``
+        """
+        results: list[tuple] = [()] * len(files)
+
+        async def _delete(index: int, file: str) -> None:
+            results[index] = await self.delete(file)
+
+        async with anyio.create_task_group() as tg:
+            for i, file in enumerate(files):
+                tg.start_soon(_delete, i, file)
+        return results
+
     async def delete(
         self, file: Annotated[str, "remote_file id or URL, e.g.: group1/M00/00/xxx.jpg"]
     ) -> tuple:
@@ -193,12 +629,11 @@ class AsyncDfsClient(BaseClient):
         ```
         """
         maybe_url = True
-        try:
-            _, uri = file.split("://")
-        except ValueError:
-            host_info = self.random_host()
-        else:
-            ip_addr, file = uri.split("/", 1)
+        host_info: tuple[str, int] | None = None
+        # partition never allocates a list, unlike split + unpack
+        _, sep, uri = file.partition("://")
+        if sep:
+            ip_addr, _, file = uri.partition("/")
             maybe_url = False
             if not is_IPv4(ip_addr):
                 ip_addr = self.get_domain_ip(ip_addr)
@@ -206,9 +641,12 @@ class AsyncDfsClient(BaseClient):
         if not (tmp := split_remote_fileid(file, maybe_url=maybe_url)):
             raise DataError("[-] Error: remote_file_id is invalid.(in delete file)")
         group_name, remote_filename = tmp
-        store_serv = await TrackerClient.get_storage_server(
-            host_info, group_name, remote_filename
-        )
+        if host_info is None:
+            store_serv = await self._get_storage_server(group_name, remote_filename)
+        else:
+            store_serv = await TrackerClient.get_storage_server(
+                host_info, group_name, remote_filename
+            )
         store = StorageClient(store_serv.ip_addr, store_serv.port, self.timeout)
         return await store.delete_file(store_serv, remote_filename)
 
@@ -227,18 +665,142 @@ class FastdfsClient(BaseClient):
         poolclass: Type[ConnectionPool] | None = None,
         ip_mapping: dict[str, str] | None = None,
         ssl: bool = True,
+        pool_config: PoolConfig | None = None,
     ) -> None:
         super().__init__(trackers, ip_mapping, ssl)
         if poolclass is None:
             poolclass = ConnectionPool
-        self.tracker_pool = poolclass(**self.trackers)
+        pool_kwargs = dict(self.trackers)
+        if pool_config is not None:
+            if pool_config.max_size is not None:
+                pool_kwargs["max_conn"] = pool_config.max_size
+            if pool_config.min_size:
+                pool_kwargs["min_conn"] = pool_config.min_size
+            if pool_config.idle_timeout is not None:
+                pool_kwargs["idle_timeout"] = pool_config.idle_timeout
+            if pool_config.connect_timeout is not None:
+                pool_kwargs["timeout"] = pool_config.connect_timeout
+            if pool_config.sndbuf is not None:
+                pool_kwargs["sndbuf"] = pool_config.sndbuf
+            if pool_config.rcvbuf is not None:
+                pool_kwargs["rcvbuf"] = pool_config.rcvbuf
+        self.tracker_pool = poolclass(**pool_kwargs)
+        self._pool_config = pool_config
+        # TrackerClient is a stateless wrapper around the pool; build it once
+        # instead of allocating a fresh one in every method
+        self._tc = TrackerClient(self.tracker_pool)
+        # storage_ip:port -> StorageClient, so live sockets are reused across
+        # operations instead of paying a TCP connect per call; entries unused
+        # for _store_idle_timeout seconds are pruned so a storage rebalance
+        # can't leave dead endpoints holding sockets forever
+        self._storage_clients: dict[tuple[str, int], StorageClient] = {}
+        self._store_last_used: dict[tuple[str, int], float] = {}
+        self._store_idle_timeout = (
+            pool_config.idle_timeout if pool_config else None
+        ) or STORE_IDLE_TIMEOUT
+        self._last_prune = time.monotonic()
+        # (group, filename) -> (timestamp, store_serv) for the modify path
+        self._update_serv_cache: dict[tuple[str, str], tuple[float, StorageServer]] = {}
+        # weakref.finalize instead of __del__: it doesn't inhibit cycle
+        # collection and registers nothing per-instance beyond the callback
+        self._finalizer = weakref.finalize(
+            self, _destroy_pools, self._storage_clients, self.tracker_pool
+        )
 
-    def __del__(self) -> None:
-        try:
-            self.pool.destroy()  # type:ignore
-            self.pool = None  # pragma: no cover
-        except Exception as e:
-            logger.debug(f"Failed to destroy: {e}")
+    def _query_storage_update(self, group_name, remote_filename) -> StorageServer:
+        """Ask the tracker which storage server handles updates for a file.
+
+        Repeated modifies of the same appender file reuse the answer for
+        `UPDATE_SERV_TTL` seconds, skipping a tracker round-trip per call.
+        """
+        key = (group_name, remote_filename)
+        now = time.monotonic()
+        if cached := self._update_serv_cache.get(key):
+            ts, store_serv = cached
+            if now - ts < UPDATE_SERV_TTL:
+                return store_serv
+        store_serv = self._tc.tracker_query_storage_update(group_name, remote_filename)
+        self._update_serv_cache[key] = (now, store_serv)
+        return store_serv
+
+    @staticmethod
+    def _parse_appender_fileid(appender_fileid) -> tuple[str, str]:
+        """Cheap pure-string validation, done before any disk or network I/O
+        so malformed ids fail for free."""
+        tmp = split_remote_fileid(appender_fileid)
+        if not tmp:
+            raise DataError("[-] Error: remote_fileid is invalid.(modify)")
+        return tmp
+
+    def _resolve_modify_target(
+        self, group_name, appender_filename
+    ) -> tuple[StorageClient, StorageServer]:
+        """Resolve the storage client handling updates for an appender file."""
+        store_serv = self._query_storage_update(group_name, appender_filename)
+        return self._get_store(store_serv), store_serv
+
+    def _prune_stores(self, now: float) -> None:
+        """Evict per-server clients that sat unused past the idle timeout."""
+        self._last_prune = now
+        for key, last_used in list(self._store_last_used.items()):
+            if now - last_used <= self._store_idle_timeout:
+                continue
+            store = self._storage_clients.get(key)
+            if store is not None and store.pool._conns_inuse:
+                # a checked-out connection means some thread is mid-RPC on
+                # this pool; destroy() would close the socket under it
+                continue
+            del self._store_last_used[key]
+            if store is not None:
+                self._storage_clients.pop(key, None)
+                try:
+                    store.pool.destroy()
+                except Exception as e:
+                    logger.debug(f"Failed to destroy: {e}")
+
+    def _get_store(self, store_serv: StorageServer) -> StorageClient:
+        now = time.monotonic()
+        if now - self._last_prune > self._store_idle_timeout / 2:
+            self._prune_stores(now)
+        key = (store_serv.ip_addr, store_serv.port)  # type:ignore[assignment]
+        self._store_last_used[key] = now
+        if (store := self._storage_clients.get(key)) is None:
+            kwargs = {}
+            if (conf := self._pool_config) is not None:
+                # the storage pools carry the upload/download bodies, so the
+                # buffer knobs matter here even more than on the tracker pool
+                kwargs = {
+                    "max_conn": conf.max_size,
+                    "idle_timeout": conf.idle_timeout,
+                    "sndbuf": conf.sndbuf,
+                    "rcvbuf": conf.rcvbuf,
+                }
+            store = StorageClient(
+                store_serv.ip_addr,  # type:ignore[arg-type]
+                store_serv.port,  # type:ignore[arg-type]
+                self.timeout,
+                **kwargs,
+            )
+            self._storage_clients[key] = store
+        return store
+
+    def close(self) -> None:
+        """Release pooled tracker/storage connections.
+
+        Long-running processes can call this (or use the client as a context
+        manager) instead of waiting for garbage collection, keeping the
+        open-file count bounded.
+        """
+        _destroy_pools(self._storage_clients, self.tracker_pool)
+        self._storage_clients.clear()
+        self._store_last_used.clear()
+        self._update_serv_cache.clear()
+
+    def __enter__(self) -> "FastdfsClient":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
 
     def upload_as_url(self, content: bytes, suffix="jpg") -> str:
         """Upload file content, if success return a URL
@@ -286,23 +848,25 @@ class FastdfsClient(BaseClient):
         } if success else None
         """
         self._check_file(filename)
-        tc = TrackerClient(self.tracker_pool)
+        tc = self._tc
         store_serv = tc.tracker_query_storage_stor_without_group()
-        store = StorageClient(store_serv.ip_addr, store_serv.port, self.timeout)
+        store = self._get_store(store_serv)
         return store.storage_upload_by_filename(
             tc, store_serv, str(filename), meta_dict
         )
 
-    def _check_file(self, filename, info="(uploading)") -> None:
-        isfile, errmsg = fdfs_check_file(filename)
-        if not isfile:
+    def _check_file(self, filename, info="(uploading)") -> int:
+        """Validate the local file and return its size -- one stat for both."""
+        size, errmsg = fdfs_check_file(filename)
+        if size is None:
             raise DataError(errmsg + info)
+        return size
 
     def upload_by_file(self, filename, meta_dict=None):
         self._check_file(filename)
-        tc = TrackerClient(self.tracker_pool)
+        tc = self._tc
         store_serv = tc.tracker_query_storage_stor_without_group()
-        store = StorageClient(store_serv.ip_addr, store_serv.port, self.timeout)
+        store = self._get_store(store_serv)
         return store.storage_upload_by_file(tc, store_serv, filename, meta_dict)
 
     def upload_by_buffer(
@@ -330,9 +894,9 @@ class FastdfsClient(BaseClient):
         """
         if not filebuffer:
             raise DataError("[-] Error: argument filebuffer can not be null.")
-        tc = TrackerClient(self.tracker_pool)
+        tc = self._tc
         store_serv = tc.tracker_query_storage_stor_without_group()
-        store = StorageClient(store_serv.ip_addr, store_serv.port, self.timeout)
+        store = self._get_store(store_serv)
         return store.storage_upload_by_buffer(
             tc, store_serv, filebuffer, file_ext_name, meta_dict
         )
@@ -367,16 +931,12 @@ class FastdfsClient(BaseClient):
         if not prefix_name:
             raise DataError("[-] Error: prefix_name can not be null.")
         group_name, remote_filename = tmp
-        tc = TrackerClient(self.tracker_pool)
+        tc = self._tc
         store_serv = tc.tracker_query_storage_stor_with_group(group_name)
-        store = StorageClient(store_serv.ip_addr, store_serv.port, self.timeout)
-        try:
-            ret_dict = store.storage_upload_slave_by_filename(
-                tc, store_serv, filename, prefix_name, remote_filename, meta_dict=None
-            )
-        except Exception as e:
-            logger.exception(e)
-            raise e
+        store = self._get_store(store_serv)
+        ret_dict = store.storage_upload_slave_by_filename(
+            tc, store_serv, filename, prefix_name, remote_filename, meta_dict=None
+        )
         ret_dict["Status"] = "Upload slave file successed."
         return ret_dict
 
@@ -410,15 +970,16 @@ class FastdfsClient(BaseClient):
         if not prefix_name:
             raise DataError("[-] Error: prefix_name can not be null.")
         group_name, remote_filename = tmp
-        tc = TrackerClient(self.tracker_pool)
+        tc = self._tc
         store_serv = tc.tracker_query_storage_stor_with_group(group_name)
-        store = StorageClient(store_serv.ip_addr, store_serv.port, self.timeout)
+        store = self._get_store(store_serv)
         try:
             ret_dict = store.storage_upload_slave_by_file(
                 tc, store_serv, filename, prefix_name, remote_filename, meta_dict=None
             )
         except Exception as e:
-            logger.exception(e)
+            # the cause chain keeps the original traceback; logging it here
+            # too would serialize it twice
             raise DataError(str(e)) from e
         ret_dict["Status"] = "Upload slave file successed."
         return ret_dict
@@ -451,9 +1012,9 @@ class FastdfsClient(BaseClient):
         if not tmp:
             raise DataError("[-] Error: remote_file_id is invalid.(uploading slave)")
         group_name, remote_filename = tmp
-        tc = TrackerClient(self.tracker_pool)
-        store_serv = tc.tracker_query_storage_update(group_name, remote_filename)
-        store = StorageClient(store_serv.ip_addr, store_serv.port, self.timeout)
+        tc = self._tc
+        store_serv = self._query_storage_update(group_name, remote_filename)
+        store = self._get_store(store_serv)
         return store.storage_upload_slave_by_buffer(
             tc, store_serv, filebuffer, remote_filename, meta_dict, file_ext_name
         )
@@ -479,9 +1040,9 @@ class FastdfsClient(BaseClient):
         } if success else None
         """
         self._check_file(local_filename, "(uploading appender)")
-        tc = TrackerClient(self.tracker_pool)
+        tc = self._tc
         store_serv = tc.tracker_query_storage_stor_without_group()
-        store = StorageClient(store_serv.ip_addr, store_serv.port, self.timeout)
+        store = self._get_store(store_serv)
         return store.storage_upload_appender_by_filename(
             tc, store_serv, local_filename, meta_dict
         )
@@ -507,9 +1068,9 @@ class FastdfsClient(BaseClient):
         } if success else None
         """
         self._check_file(local_filename, "(uploading appender)")
-        tc = TrackerClient(self.tracker_pool)
+        tc = self._tc
         store_serv = tc.tracker_query_storage_stor_without_group()
-        store = StorageClient(store_serv.ip_addr, store_serv.port, self.timeout)
+        store = self._get_store(store_serv)
         return store.storage_upload_appender_by_file(
             tc, store_serv, local_filename, meta_dict
         )
@@ -532,9 +1093,9 @@ class FastdfsClient(BaseClient):
         """
         if not filebuffer:
             raise DataError("[-] Error: argument filebuffer can not be null.")
-        tc = TrackerClient(self.tracker_pool)
+        tc = self._tc
         store_serv = tc.tracker_query_storage_stor_without_group()
-        store = StorageClient(store_serv.ip_addr, store_serv.port, self.timeout)
+        store = self._get_store(store_serv)
         return store.storage_upload_appender_by_buffer(
             tc, store_serv, filebuffer, meta_dict, file_ext_name
         )
@@ -550,11 +1111,40 @@ class FastdfsClient(BaseClient):
         if not tmp:
             raise DataError("[-] Error: remote_file_id is invalid.(in delete file)")
         group_name, remote_filename = tmp
-        tc = TrackerClient(self.tracker_pool)
+        tc = self._tc
         store_serv = tc.tracker_query_storage_update(group_name, remote_filename)
-        store = StorageClient(store_serv.ip_addr, store_serv.port, self.timeout)
+        store = self._get_store(store_serv)
         return store.storage_delete_file(tc, store_serv, remote_filename)
 
+    def delete_files(
+        self, remote_file_ids: list[str], max_workers: int = 8
+    ) -> list[tuple[str, bytes, bytes] | Exception]:
+        """
+        Delete several files from Storage server concurrently.
+
+        The workers share the client's TrackerClient and per-server storage
+        cache, so each thread only pays for its own RPC; throughput scales
+        with the connection pool instead of one socket's round-trip time.
+        arguments:
+        @remote_file_ids: list of remote file ids
+        @max_workers: max threads in flight at once
+        @return list, per-file results in the same order as the input;
+                a file whose delete failed gets its exception in the slot
+                instead of aborting the rest of the batch
+        """
+        results: list = [None] * len(remote_file_ids)
+
+        def _delete(index: int, remote_file_id: str) -> None:
+            try:
+                results[index] = self.delete_file(remote_file_id)
+            except Exception as e:
+                results[index] = e
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for i, remote_file_id in enumerate(remote_file_ids):
+                executor.submit(_delete, i, remote_file_id)
+        return results
+
     def download_to_file(self, local_filename, remote_file_id, offset=0, down_bytes=0):
         """
         Download a file from Storage server.
@@ -574,15 +1164,11 @@ class FastdfsClient(BaseClient):
         if not tmp:
             raise DataError("[-] Error: remote_file_id is invalid.(in download file)")
         group_name, remote_filename = tmp
-        file_offset = 0
-        if offset:
-            with contextlib.suppress(TypeError, ValueError):
-                file_offset = int(offset)
-        if not down_bytes:
-            download_bytes = int(down_bytes)
-        tc = TrackerClient(self.tracker_pool)
+        file_offset = _as_int(offset)
+        download_bytes = _as_int(down_bytes)
+        tc = self._tc
         store_serv = tc.tracker_query_storage_fetch(group_name, remote_filename)
-        store = StorageClient(store_serv.ip_addr, store_serv.port, self.timeout)
+        store = self._get_store(store_serv)
         return store.storage_download_to_file(
             tc, store_serv, local_filename, file_offset, download_bytes, remote_filename
         )
@@ -605,16 +1191,14 @@ class FastdfsClient(BaseClient):
         if not tmp:
             raise DataError("[-] Error: remote_file_id is invalid.(in download file)")
         group_name, remote_filename = tmp
-        file_offset = 0
-        if offset:
-            with contextlib.suppress(TypeError, ValueError):
-                file_offset = int(offset)
-        if not down_bytes:
-            download_bytes = int(down_bytes)
-        tc = TrackerClient(self.tracker_pool)
+        file_offset = _as_int(offset)
+        download_bytes = _as_int(down_bytes)
+        tc = self._tc
         store_serv = tc.tracker_query_storage_fetch(group_name, remote_filename)
-        store = StorageClient(store_serv.ip_addr, store_serv.port, self.timeout)
-        file_buffer = None
+        store = self._get_store(store_serv)
+        # when the size is known up front, hand down a preallocated buffer so
+        # the storage client can recv_into it instead of chunk-and-join
+        file_buffer = bytearray(download_bytes) if download_bytes else None
         return store.storage_download_to_buffer(
             tc, store_serv, file_buffer, file_offset, download_bytes, remote_filename
         )
@@ -626,7 +1210,7 @@ class FastdfsClient(BaseClient):
         @group_name: string, group name will be list
         @return Group_info,  instance
         """
-        tc = TrackerClient(self.tracker_pool)
+        tc = self._tc
         return tc.tracker_list_one_group(group_name)
 
     def list_servers(self, group_name, storage_ip=None):
@@ -639,7 +1223,7 @@ class FastdfsClient(BaseClient):
             'Servers'    : server list,
         }
         """
-        tc = TrackerClient(self.tracker_pool)
+        tc = self._tc
         return tc.tracker_list_servers(group_name, storage_ip)
 
     def list_all_groups(self):
@@ -650,7 +1234,7 @@ class FastdfsClient(BaseClient):
             'Groups'       : list of groups
         }
         """
-        tc = TrackerClient(self.tracker_pool)
+        tc = self._tc
         return tc.tracker_list_all_groups()
 
     def get_meta_data(self, remote_file_id):
@@ -664,9 +1248,9 @@ class FastdfsClient(BaseClient):
         if not tmp:
             raise DataError("[-] Error: remote_file_id is invalid.(in get meta data)")
         group_name, remote_filename = tmp
-        tc = TrackerClient(self.tracker_pool)
-        store_serv = tc.tracker_query_storage_update(group_name, remote_filename)
-        store = StorageClient(store_serv.ip_addr, store_serv.port, self.timeout)
+        tc = self._tc
+        store_serv = self._query_storage_update(group_name, remote_filename)
+        store = self._get_store(store_serv)
         return store.storage_get_metadata(tc, store_serv, remote_filename)
 
     def set_meta_data(
@@ -687,15 +1271,10 @@ class FastdfsClient(BaseClient):
         if not tmp:
             raise DataError("[-] Error: remote_file_id is invalid.(in set meta data)")
         group_name, remote_filename = tmp
-        tc = TrackerClient(self.tracker_pool)
-        try:
-            store_serv = tc.tracker_query_storage_update(group_name, remote_filename)
-            store = StorageClient(store_serv.ip_addr, store_serv.port, self.timeout)
-            status = store.storage_set_metadata(
-                tc, store_serv, remote_filename, meta_dict
-            )
-        except (ConnectionError, ResponseError, DataError):
-            raise
+        tc = self._tc
+        store_serv = self._query_storage_update(group_name, remote_filename)
+        store = self._get_store(store_serv)
+        status = store.storage_set_metadata(tc, store_serv, remote_filename, meta_dict)
         if status == 2:
             raise DataError(
                 "[-] Error: remote file %s does not exist." % remote_file_id
@@ -713,9 +1292,9 @@ class FastdfsClient(BaseClient):
         if not tmp:
             raise DataError("[-] Error: remote_file_id is invalid.(append)")
         group_name, appended_filename = tmp
-        tc = TrackerClient(self.tracker_pool)
-        store_serv = tc.tracker_query_storage_update(group_name, appended_filename)
-        store = StorageClient(store_serv.ip_addr, store_serv.port, self.timeout)
+        tc = self._tc
+        store_serv = self._query_storage_update(group_name, appended_filename)
+        store = self._get_store(store_serv)
         return store.storage_append_by_filename(
             tc, store_serv, local_filename, appended_filename
         )
@@ -726,9 +1305,9 @@ class FastdfsClient(BaseClient):
         if not tmp:
             raise DataError("[-] Error: remote_file_id is invalid.(append)")
         group_name, appended_filename = tmp
-        tc = TrackerClient(self.tracker_pool)
-        store_serv = tc.tracker_query_storage_update(group_name, appended_filename)
-        store = StorageClient(store_serv.ip_addr, store_serv.port, self.timeout)
+        tc = self._tc
+        store_serv = self._query_storage_update(group_name, appended_filename)
+        store = self._get_store(store_serv)
         return store.storage_append_by_file(
             tc, store_serv, local_filename, appended_filename
         )
@@ -740,9 +1319,9 @@ class FastdfsClient(BaseClient):
         if not tmp:
             raise DataError("[-] Error: remote_file_id is invalid.(append)")
         group_name, appended_filename = tmp
-        tc = TrackerClient(self.tracker_pool)
-        store_serv = tc.tracker_query_storage_update(group_name, appended_filename)
-        store = StorageClient(store_serv.ip_addr, store_serv.port, self.timeout)
+        tc = self._tc
+        store_serv = self._query_storage_update(group_name, appended_filename)
+        store = self._get_store(store_serv)
         return store.storage_append_by_buffer(
             tc, store_serv, file_buffer, appended_filename
         )
@@ -763,69 +1342,65 @@ class FastdfsClient(BaseClient):
         if not tmp:
             raise DataError("[-] Error: appender_fileid is invalid.(truncate)")
         group_name, appender_filename = tmp
-        tc = TrackerClient(self.tracker_pool)
-        store_serv = tc.tracker_query_storage_update(group_name, appender_filename)
-        store = StorageClient(store_serv.ip_addr, store_serv.port, self.timeout)
+        tc = self._tc
+        store_serv = self._query_storage_update(group_name, appender_filename)
+        store = self._get_store(store_serv)
         return store.storage_truncate_file(
             tc, store_serv, trunc_filesize, appender_filename
         )
 
-    def modify_by_filename(self, filename, appender_fileid, offset=0):
+    def modify_by_filename(self, filename, appender_fileid, offset=0, filesize=None):
         """
         Modify a file in Storage server by file.
         arguments:
         @filename: string, local file name
         @offset: long, file offset
         @appender_fileid: string, remote file id
+        @filesize: long, pass a known size to skip the stat syscall
+                   (bulk callers can stat once and reuse it across chunks)
         @return: dictionary {
             'Status'     : 'Modify successed.',
             'Storage IP' : storage_ip
         }
         """
-        self._check_file(filename, "(modify)")
-        filesize = os.stat(filename).st_size
-        tmp = split_remote_fileid(appender_fileid)
-        if not tmp:
-            raise DataError("[-] Error: remote_fileid is invalid.(modify)")
-        group_name, appender_filename = tmp
-        file_offset = 0
-        if offset:
-            with contextlib.suppress(TypeError, ValueError):
-                file_offset = int(offset)
-        tc = TrackerClient(self.tracker_pool)
-        store_serv = tc.tracker_query_storage_update(group_name, appender_filename)
-        store = StorageClient(store_serv.ip_addr, store_serv.port, self.timeout)
+        group_name, appender_filename = self._parse_appender_fileid(appender_fileid)
+        file_offset = _as_int(offset)
+        if filesize is None:
+            filesize = self._check_file(filename, "(modify)")
+        if not filesize:  # nothing to write, skip the tracker+storage RTTs
+            return {"Status": "Modify skipped (empty content).", "Storage IP": None}
+        store, store_serv = self._resolve_modify_target(group_name, appender_filename)
         return store.storage_modify_by_filename(
-            tc, store_serv, filename, file_offset, filesize, appender_filename
+            self._tc, store_serv, filename, file_offset, filesize, appender_filename
         )
 
-    def modify_by_file(self, filename, appender_fileid, offset=0):
+    def modify_by_file(self, filename, appender_fileid, offset=0, filesize=None):
         """
         Modify a file in Storage server by file.
         arguments:
-        @filename: string, local file name
+        @filename: string local file name, or an already-open binary file
+                   object (saves the reopen + stat; the fd is sendfile'd as-is)
         @offset: long, file offset
         @appender_fileid: string, remote file id
+        @filesize: long, pass a known size to skip the stat syscall
+                   (bulk callers can stat once and reuse it across chunks)
         @return: dictionary {
             'Status'     : 'Modify successed.',
             'Storage IP' : storage_ip
         }
         """
-        self._check_file(filename, "(modify)")
-        filesize = os.stat(filename).st_size
-        tmp = split_remote_fileid(appender_fileid)
-        if not tmp:
-            raise DataError("[-] Error: remote_fileid is invalid.(modify)")
-        group_name, appender_filename = tmp
-        file_offset = 0
-        if offset:
-            with contextlib.suppress(TypeError, ValueError):
-                file_offset = int(offset)
-        tc = TrackerClient(self.tracker_pool)
-        store_serv = tc.tracker_query_storage_update(group_name, appender_filename)
-        store = StorageClient(store_serv.ip_addr, store_serv.port, self.timeout)
+        group_name, appender_filename = self._parse_appender_fileid(appender_fileid)
+        file_offset = _as_int(offset)
+        if filesize is None:
+            if hasattr(filename, "fileno"):
+                filesize = os.fstat(filename.fileno()).st_size
+            else:
+                filesize = self._check_file(filename, "(modify)")
+        if not filesize:  # nothing to write, skip the tracker+storage RTTs
+            return {"Status": "Modify skipped (empty content).", "Storage IP": None}
+        store, store_serv = self._resolve_modify_target(group_name, appender_filename)
         return store.storage_modify_by_file(
-            tc, store_serv, filename, file_offset, filesize, appender_filename
+            self._tc, store_serv, filename, file_offset, filesize, appender_filename
         )
 
     def modify_by_buffer(self, filebuffer, appender_fileid, offset=0):
@@ -840,26 +1415,20 @@ class FastdfsClient(BaseClient):
             'Storage IP' : storage_ip
         }
         """
+        group_name, appender_filename = self._parse_appender_fileid(appender_fileid)
+        file_offset = _as_int(offset)
         if not filebuffer:
             raise DataError("[-] Error: filebuffer can not be null.(modify)")
         filesize = len(filebuffer)
-        tmp = split_remote_fileid(appender_fileid)
-        if not tmp:
-            raise DataError("[-] Error: remote_fileid is invalid.(modify)")
-        group_name, appender_filename = tmp
-        file_offset = 0
-        if offset:
-            with contextlib.suppress(TypeError, ValueError):
-                file_offset = int(offset)
-        tc = TrackerClient(self.tracker_pool)
-        store_serv = tc.tracker_query_storage_update(group_name, appender_filename)
-        store = StorageClient(store_serv.ip_addr, store_serv.port, self.timeout)
+        store, store_serv = self._resolve_modify_target(group_name, appender_filename)
         return store.storage_modify_by_buffer(
-            tc, store_serv, filebuffer, file_offset, filesize, appender_filename
+            self._tc, store_serv, filebuffer, file_offset, filesize, appender_filename
         )
 
-    @property
+    @cached_property
     def async_client(self) -> "AsyncDfsClient":
+        # Cached so repeated upload/delete calls share one warm client
+        # (and its preferred-tracker cache) instead of building a new one
         return AsyncDfsClient(self.trackers, self.ip_mapping, self.ssl)
 
     async def upload(self, content: bytes, suffix=".jpg") -> str:
@@ -868,5 +1437,38 @@ class FastdfsClient(BaseClient):
     async def delete(self, file: str) -> tuple:
         return await self.async_client.delete(file)
 
+    async def upload_path(self, path: str | Path, suffix: str | None = None) -> str:
+        return await self.async_client.upload_path(path, suffix)
+
+    async def upload_and_delete(
+        self, content: bytes, suffix=".jpg"
+    ) -> tuple[str, tuple]:
+        return await self.async_client.upload_and_delete(content, suffix)
+
+    async def upload_many(
+        self, items: list[tuple[bytes, str]], concurrency: int = 16
+    ) -> list[str]:
+        return await self.async_client.upload_many(items, concurrency)
+
+    async def upload_paths(
+        self, paths: list[str | Path], concurrency: int = 16
+    ) -> list[str]:
+        return await self.async_client.upload_paths(paths, concurrency)
+
+    async def delete_many(self, files: list[str]) -> list[tuple]:
+        return await self.async_client.delete_many(files)
+
+    async def modify(self, filebuffer: bytes, appender_fileid: str, offset=0) -> dict:
+        # named `modify` as the modify_by_* names are taken by the sync API
+        return await self.async_client.modify_by_buffer(
+            filebuffer, appender_fileid, offset
+        )
+
     upload.__doc__ = AsyncDfsClient.upload.__doc__
     delete.__doc__ = AsyncDfsClient.delete.__doc__
+    upload_path.__doc__ = AsyncDfsClient.upload_path.__doc__
+    upload_and_delete.__doc__ = AsyncDfsClient.upload_and_delete.__doc__
+    upload_many.__doc__ = AsyncDfsClient.upload_many.__doc__
+    upload_paths.__doc__ = AsyncDfsClient.upload_paths.__doc__
+    delete_many.__doc__ = AsyncDfsClient.delete_many.__doc__
+    modify.__doc__ = AsyncDfsClient.modify_by_buffer.__doc__
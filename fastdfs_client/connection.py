@@ -2,32 +2,86 @@ from __future__ import annotations
 
 import operator
 import os
-import random
 import socket
+import time
+import weakref
+from collections import deque
 from contextlib import contextmanager
-from itertools import chain
+from dataclasses import dataclass
+from itertools import chain, count
 from typing import Callable, Generator
 
 from .exceptions import ConnectionError, ResponseError
 from .utils import logger
 
+# With register_at_fork the pool is reset exactly once in the child, so
+# the per-operation getpid() comparison is only needed where it's absent
+_HAS_AT_FORK = hasattr(os, "register_at_fork")
+
+# sendmsg is POSIX-only; Windows falls back to sequential sendall calls
+_HAS_SENDMSG = hasattr(socket.socket, "sendmsg")
+
+# Round-robin start index plus a short quarantine for unreachable hosts:
+# with random selection a dead tracker keeps being picked with
+# probability 1/N, costing a full connect timeout per hit
+_rr_counter = count()
+_bad_hosts: dict[str, float] = {}
+BAD_HOST_TTL = 5.0  # seconds an unreachable host is skipped before retrying
+
+
+@dataclass
+class PoolConfig:
+    """Tuning knobs for the connection pool.
+
+    :param max_size: max connections the pool may create
+    :param min_size: connections opened eagerly at construction, so the TCP
+        handshake is not paid on the first request
+    :param idle_timeout: seconds an idle connection is kept warm before being dropped
+    :param connect_timeout: socket timeout in seconds, overrides the tracker conf one
+    :param sndbuf: SO_SNDBUF size in bytes, enlarge it for big uploads on fat links
+    :param rcvbuf: SO_RCVBUF size in bytes, enlarge it for big downloads
+
+    Example::
+    ```py
+    from fastdfs_client import FastdfsClient, PoolConfig
+
+    client = FastdfsClient(['example.com'], pool_config=PoolConfig(max_size=10))
+    ```
+    """
+
+    max_size: int | None = None
+    min_size: int = 0
+    idle_timeout: float | None = None
+    connect_timeout: int | None = None
+    sndbuf: int | None = None
+    rcvbuf: int | None = None
+
+
+def _safe_close(sock) -> None:
+    # runs from weakref.finalize after the Connection is collected, so it
+    # must not raise and must not reference the connection itself
+    try:
+        sock.close()
+    except OSError as e:
+        logger.debug(f"close error: {e}")
+
 
 class Connection:
     """Manage TCP comunication to and from Fastdfs Server."""
 
-    def __init__(self, host_tuple, port, timeout, **kwargs) -> None:
+    def __init__(
+        self, host_tuple, port, timeout, sndbuf=None, rcvbuf=None, **kwargs
+    ) -> None:
         self.host_tuple = host_tuple
         self.remote_port = port
         self.timeout = timeout
+        self.sndbuf = sndbuf
+        self.rcvbuf = rcvbuf
         self.pid = os.getpid()
         self.remote_addr = None
         self._sock = None
-
-    def __del__(self):
-        try:
-            self.disconnect()
-        except Exception as e:
-            logger.debug(f"disconnect error: {e}")
+        self._finalizer = None
+        self.idle_since = 0.0
 
     def connect(self):
         """Connect to fdfs server."""
@@ -37,25 +91,68 @@ class Connection:
             self._sock = self._connect()
         except socket.error as e:
             raise ConnectionError(self._errormessage(e)) from e
+        # weakref.finalize instead of __del__: no per-instance finalizer
+        # overhead and the cycle collector can treat pooled connections
+        # like plain objects
+        self._finalizer = weakref.finalize(self, _safe_close, self._sock)
         # print '[+] Create a connection success.'
         # print '\tLocal address is %s:%s.' % self._sock.getsockname()
         # print '\tRemote address is %s:%s' % (self.remote_addr, self.remote_port)
 
+    def _pick_host(self) -> str:
+        """Choose the next host round-robin, skipping quarantined ones."""
+        hosts = self.host_tuple
+        if (n := len(hosts)) == 1:
+            return hosts[0]
+        now = time.monotonic()
+        start = next(_rr_counter)
+        for i in range(n):
+            host = hosts[(start + i) % n]
+            if _bad_hosts.get(host, 0) <= now:
+                return host
+        # every host is quarantined: try one anyway rather than fail fast
+        return hosts[start % n]
+
     def _connect(self):
-        """Create TCP socket. The host is random one of host_tuple."""
-        self.remote_addr = random.choice(self.host_tuple)
+        """Create TCP socket, rotating through host_tuple."""
+        self.remote_addr = self._pick_host()
         # print '[+] Connecting... remote: %s:%s' % (self.remote_addr, self.remote_port)
-        # sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        # sock.settimeout(self.timeout)
-        sock = socket.create_connection(
-            (self.remote_addr, self.remote_port), self.timeout
-        )
+        try:
+            sock = socket.create_connection(
+                (self.remote_addr, self.remote_port), self.timeout
+            )
+        except socket.error:
+            _bad_hosts[self.remote_addr] = time.monotonic() + BAD_HOST_TTL
+            raise
+        # Keep pooled sockets warm so idle connections survive between calls
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        if hasattr(socket, "TCP_KEEPIDLE"):  # linux only
+            # probe after 60s idle, then every 10s, give up after 3 misses:
+            # a silently reset pooled socket is evicted by the kernel well
+            # before the distro default of two idle hours
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)
+        # Small command/ack exchanges stall up to 40ms with Nagle + delayed
+        # ACK enabled; the fdfs protocol is strictly request/response
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if hasattr(socket, "TCP_QUICKACK"):  # linux only
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+        # Default kernel buffers can cap throughput below the link's
+        # bandwidth-delay product; only override when explicitly configured
+        if self.sndbuf:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.sndbuf)
+        if self.rcvbuf:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.rcvbuf)
         return sock
 
     def disconnect(self) -> None:
         """Disconnect from fdfs server."""
         if self._sock is None:
             return
+        if self._finalizer is not None:
+            self._finalizer.detach()  # explicit close below, avoid doubling up
+            self._finalizer = None
         try:
             self._sock.close()
         except socket.error as e:
@@ -83,27 +180,81 @@ class Connection:
             )
 
 
+# One process-wide fork hook over a WeakSet of live pools: register_at_fork
+# callbacks can never be unregistered, so per-pool registrations would pile
+# up dead closures in processes that create and prune pools over time
+_live_pools: "weakref.WeakSet[ConnectionPool]" = weakref.WeakSet()
+
+
+def _reset_pools_after_fork() -> None:
+    for pool in list(_live_pools):
+        pool.pid = os.getpid()
+        # drop (not destroy) parent-owned connections: the child's fd
+        # copies are closed by their finalizers
+        pool._init()
+
+
+if _HAS_AT_FORK:  # not on Windows
+    os.register_at_fork(after_in_child=_reset_pools_after_fork)
+
+
 class ConnectionPool:
     """Generic Connection Pool"""
 
     def __init__(
-        self, name="", conn_class=Connection, max_conn=None, **conn_kwargs
+        self,
+        name="",
+        conn_class=Connection,
+        max_conn=None,
+        idle_timeout=None,
+        min_conn=0,
+        **conn_kwargs,
     ) -> None:
         self.pool_name = name
         self.pid = os.getpid()
         self.conn_class = conn_class
         self.max_conn = max_conn or 2**31
+        self.idle_timeout = idle_timeout
         self.conn_kwargs = conn_kwargs
         self._init()
+        if min_conn:
+            self._prewarm(min_conn)
+        # Reset the pool once at fork time instead of comparing getpid()
+        # on every checkout/release; the shared WeakSet neither pins the
+        # pool alive nor leaves anything behind once it is collected
+        if _HAS_AT_FORK:  # not on Windows
+            _live_pools.add(self)
+
+    def _prewarm(self, min_conn: int) -> None:
+        """Open ``min_conn`` connections up front.
+
+        The TCP handshakes are paid at construction instead of showing up
+        as first-request latency; a briefly unreachable server downgrades
+        the prewarm to a debug log rather than failing the pool.
+        """
+        for _ in range(min_conn):
+            try:
+                conn = self.make_conn()
+            except ConnectionError as e:
+                logger.debug(f"Prewarm stopped: {e}")
+                break
+            conn.idle_since = time.monotonic()
+            self._conns_available.append(conn)
+            self._conns_available_set.add(conn)
 
     def _init(self) -> None:
         self._conns_created = 0
-        self._conns_available: list[Connection] = []
+        # deque append/popleft are single atomic ops under the GIL, so
+        # checkout/release need no lock even with concurrent threads;
+        # the mirror set gives remove() O(1) membership tests
+        self._conns_available: deque[Connection] = deque()
+        self._conns_available_set: set[Connection] = set()
         self._conns_inuse: set[Connection] = set()
 
     def _check_pid(self) -> None:
+        # fallback for platforms without os.register_at_fork
         if self.pid != os.getpid():
-            self.destroy()
+            self.pid = os.getpid()
             self._init()
 
     def make_conn(self) -> Connection:
@@ -111,31 +262,55 @@ class ConnectionPool:
         if self._conns_created >= self.max_conn:
             raise ConnectionError("[-] Error: Too many connections.")
         num_try = 10
-        for _ in range(num_try):
+        # one Connection reused across attempts; a failed connect() leaves
+        # it socketless and ready for the next try
+        conn_instance = self.conn_class(**self.conn_kwargs)
+        for i in range(num_try):
             try:
-                conn_instance = self.conn_class(**self.conn_kwargs)
                 conn_instance.connect()
                 self._conns_created += 1
                 break
             except ConnectionError as e:
                 logger.debug(e)
+                now = time.monotonic()
+                if all(_bad_hosts.get(h, 0) > now for h in conn_instance.host_tuple):
+                    # tracker-wide outage: back off instead of hammering,
+                    # capped so worst-case acquire time stays bounded
+                    time.sleep(min(0.5, 0.01 * 2**i))
         else:
             raise ConnectionError(f"Failed to connect with {num_try} times")
         return conn_instance
 
     def get_connection(self) -> Connection:
         """Get a connection from pool."""
-        self._check_pid()
-        try:
-            conn = self._conns_available.pop()
-            # print '[+] Get a connection from pool %s.' % self.pool_name
-            # print '\tLocal address is %s:%s.' % conn._sock.getsockname()
-            # print '\tRemote address is %s:%s' % (conn.remote_addr, conn.remote_port)
-        except IndexError:
-            conn = self.make_conn()
+        if not _HAS_AT_FORK:
+            self._check_pid()
+        while True:
+            try:
+                # FIFO reuse: the longest-idle connection is checked first,
+                # so stale ones are noticed and dropped promptly
+                conn = self._conns_available.popleft()
+                self._conns_available_set.discard(conn)
+                # print '[+] Get a connection from pool %s.' % self.pool_name
+                # print '\tLocal address is %s:%s.' % conn._sock.getsockname()
+                # print '\tRemote address is %s:%s' % (conn.remote_addr, conn.remote_port)
+            except IndexError:
+                conn = self.make_conn()
+            else:
+                if self._is_stale(conn):
+                    conn.disconnect()
+                    self._conns_created -= 1
+                    continue
+            break
         self._conns_inuse.add(conn)
         return conn
 
+    def _is_stale(self, conn: Connection) -> bool:
+        """Whether an idle connection outlived ``idle_timeout``."""
+        if self.idle_timeout is None:
+            return False
+        return time.monotonic() - conn.idle_since > self.idle_timeout
+
     @contextmanager
     def open_connection(self) -> Generator[Connection, None, None]:
         conn = self.get_connection()
@@ -149,47 +324,77 @@ class ConnectionPool:
         if conn in self._conns_inuse:
             self._conns_inuse.remove(conn)
             self._conns_created -= 1
-        if conn in self._conns_available:
+        if conn in self._conns_available_set:
+            self._conns_available_set.remove(conn)
             self._conns_available.remove(conn)
             self._conns_created -= 1
 
     def destroy(self) -> None:
-        """Disconnect all connections in the pool."""
+        """Disconnect all connections in the pool and drop the references."""
         all_conns = chain(self._conns_inuse, self._conns_available)
         for conn in all_conns:
             conn.disconnect()
             # print '[-] Destroy connection pool %s.' % self.pool_name
+        # without the clears the containers keep the Connection objects
+        # (and their sockets) alive until the pool itself is collected
+        self._conns_inuse.clear()
+        self._conns_available.clear()
+        self._conns_available_set.clear()
+        self._conns_created = 0
 
     def release(self, conn) -> None:
         """Release the connection back to the pool."""
-        self._check_pid()
+        if not _HAS_AT_FORK:
+            self._check_pid()
         if conn.pid == self.pid:
             self._conns_inuse.remove(conn)
+            conn.idle_since = time.monotonic()
             self._conns_available.append(conn)
+            self._conns_available_set.add(conn)
             # print '[-] Release connection back to pool %s.' % self.pool_name
 
 
-def tcp_recv_response(conn, bytes_size, buffer_size=4096) -> tuple[bytes, int]:
+def tcp_recv_response(conn, bytes_size, buffer_size=4096) -> tuple[bytearray, int]:
     """Receive response from server.
     It is not include tracker header.
     arguments:
     @conn: connection
     @bytes_size: int, will be received byte_stream size
-    @buffer_size: int, receive buffer size
+    @buffer_size: int, kept for backward compatibility, no longer used
     @Return: tuple,(response, received_size)
+
+    The payload size is known up front, so the body is received straight
+    into one preallocated buffer: no per-chunk bytes objects, no final
+    join, and a peer that closes mid-body returns short instead of
+    spinning on empty reads.
     """
-    recv_buff = []
+    buf = bytearray(bytes_size)
+    total_size = tcp_recv_into(conn, buf)
+    return (buf, total_size)
+
+
+def tcp_recv_into(conn, buffer) -> int:
+    """Receive up to ``len(buffer)`` bytes into a preallocated buffer.
+
+    recv_into writes straight into the caller's buffer, skipping the
+    per-chunk bytes objects and the final join of `tcp_recv_response`.
+    arguments:
+    @conn: connection
+    @buffer: writable buffer (bytearray/memoryview) sized to the payload
+    @Return: int, received size
+    """
+    view = memoryview(buffer)
     total_size = 0
     try:
-        while bytes_size > 0:
-            resp = conn._sock.recv(buffer_size)
-            recv_buff.append(resp)
-            total_size += len(resp)
-            bytes_size -= len(resp)
+        while total_size < len(view):
+            received = conn._sock.recv_into(view[total_size:])
+            if not received:
+                break
+            total_size += received
     except (socket.error, socket.timeout) as e:
         msg = "[-] Error: while reading from socket: (%s)" % e.args
         raise ConnectionError(msg) from e
-    return (b"".join(recv_buff), total_size)
+    return total_size
 
 
 async def tcp_receive(
@@ -199,24 +404,51 @@ async def tcp_receive(
     compare: Callable = operator.eq,
     clsname="Tracker",
     *,
-    buffer_size=4096,
+    buffer_size=65536,
 ) -> bytes:
-    recv_bs = []
+    # Preallocate the whole body and fill it in place, instead of collecting
+    # per-chunk bytes objects and paying a full-size join at the end
+    buf = bytearray(bytes_size)
+    view = memoryview(buf)
     total_size = 0
     while bytes_size > 0:
         try:
-            response = await client.receive(buffer_size)
+            response = await client.receive(min(bytes_size, buffer_size))
         except Exception as e:
             logger.exception(e)
         else:
-            recv_bs.append(response)
             length = len(response)
+            view[total_size : total_size + length] = response
             total_size += length
             bytes_size -= length
     if expected_len is not None and not compare(total_size, expected_len):
         msg = f"[-] Error: {clsname} response length is not match, expect: {expected_len}, actual: {total_size}"
         raise ResponseError(msg)
-    return b"".join(recv_bs)
+    return bytes(view[:total_size])
+
+
+def tcp_send_datav(conn, *buffers) -> None:
+    """Send several buffers with one scatter-gather syscall.
+
+    Avoids both joining the buffers (a full copy of the payload) and
+    sending them one by one (a syscall per piece).
+    Falls back to sequential sends where sendmsg is unavailable (Windows).
+    arguments:
+    @conn: connection
+    @buffers: bytes-like pieces, sent as if concatenated
+    """
+    if not _HAS_SENDMSG:
+        for buf in buffers:
+            tcp_send_data(conn, buf)
+        return
+    try:
+        sent = conn._sock.sendmsg(buffers)
+        total = sum(len(b) for b in buffers)
+        if sent < total:  # rare partial send, push out the remainder
+            conn._sock.sendall(memoryview(b"".join(buffers))[sent:])
+    except (socket.error, socket.timeout) as e:
+        msg = "[-] Error: while writting to socket: (%s)" % e.args
+        raise ConnectionError(msg) from e
 
 
 def tcp_send_data(conn, bytes_stream) -> None:
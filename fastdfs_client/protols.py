@@ -3,6 +3,7 @@ import socket
 import struct
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
+from typing import ClassVar
 
 from .exceptions import ConnectionError, DataError, FDFSError
 
@@ -190,6 +191,13 @@ class StorageServer:
                 "'anyio' is required! You may need to run: `pip install anyio`"
             ) from None
         async with await connection as client:
+            # The fdfs exchange is strictly request/response; make sure small
+            # header/ack writes go out immediately instead of waiting on Nagle
+            try:
+                sock = client.extra(anyio.abc.SocketAttribute.raw_socket)
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            except Exception:  # pragma: no cover - backend without raw socket
+                pass
             yield client
 
 
@@ -209,8 +217,9 @@ class TrackerHeader:
         }
     """
 
-    fmt: str = "!QBB"  # pkg_len[FDFS_PROTO_PKG_LEN_SIZE] + cmd + status
-    st: Struct = Struct(fmt)
+    # fmt/st are compiled once at import so per-request headers reuse them
+    fmt: ClassVar[str] = "!QBB"  # pkg_len[FDFS_PROTO_PKG_LEN_SIZE] + cmd + status
+    st: ClassVar[Struct] = Struct(fmt)
     pkg_len: int = 0
     cmd: int = 0
     status: int = 0
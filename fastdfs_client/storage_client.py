@@ -1,14 +1,21 @@
 from __future__ import annotations
 
-import errno
 import operator
 import os
 import platform
+import socket
 import struct
 import sys
 from typing import cast
 
-from .connection import ConnectionPool, tcp_receive, tcp_recv_response, tcp_send_data
+from .connection import (
+    ConnectionPool,
+    tcp_receive,
+    tcp_recv_into,
+    tcp_recv_response,
+    tcp_send_data,
+    tcp_send_datav,
+)
 from .exceptions import (
     ConnectionError,
     DataError,
@@ -34,6 +41,7 @@ from .protols import (
     STORAGE_PROTO_CMD_UPLOAD_APPENDER_FILE,
     STORAGE_PROTO_CMD_UPLOAD_FILE,
     STORAGE_PROTO_CMD_UPLOAD_SLAVE_FILE,
+    STORAGE_SET_METADATA_FLAG_MERGE,
     STORAGE_SET_METADATA_FLAG_OVERWRITE,
     StorageServer,
     fdfs_pack_metadata,
@@ -46,7 +54,22 @@ from .utils import (
     logger,
 )
 
+try:
+    import anyio
+except ImportError:
+    anyio = None  # type:ignore[assignment]
+
 __os_sep__ = "/" if platform.system() == "Windows" else os.sep
+# Bodies up to this size are joined with the header into one send;
+# larger ones are sent separately to avoid copying the whole payload
+COALESCE_MAX_SIZE = 64 * 1024
+# struct's 'c' wants a length-1 bytes object; pre-encode the metadata op
+# flags once so set_metadata neither re-encodes per call nor trips over
+# the str constants from protols
+_META_OP_FLAGS = {
+    STORAGE_SET_METADATA_FLAG_OVERWRITE: b"O",
+    STORAGE_SET_METADATA_FLAG_MERGE: b"M",
+}
 
 
 def _send_data(conn, fp, buffer_size) -> int:
@@ -83,7 +106,9 @@ def tcp_send_file(conn, filename, buffer_size=1024):
 
 def tcp_send_file_ex(conn, filename, buffer_size=4096):
     """
-    Send file to server. Using linux system call 'sendfile'.
+    Send file to server. Using 'sendfile' system call(zero-copy) when available,
+    so the file content is spliced from page cache to socket without being
+    materialized in userspace.
     arguments:
     @conn: connection
     @filename: string
@@ -91,27 +116,19 @@ def tcp_send_file_ex(conn, filename, buffer_size=4096):
     """
     if sys.platform.lower().startswith("win"):
         raise DataError("[-] Error: 'sendfile' system call only available on linux.")
-    nbytes = offset = 0
-    sock_fd = conn.get_sock().fileno()
-    with open(filename, "rb") as f:
-        in_fd = f.fileno()
-        while 1:
-            try:
-                logger.debug(f"{nbytes = };{offset = };{sock_fd = };{in_fd = }")
-                raise NotImplementedError("sendfile not ready yet.")
-                # sent = sendfile(sock_fd, in_fd, offset, buffer_size)
-                # if 0 == sent:
-                #     break
-                # nbytes += sent
-                # offset += sent
-            except OSError as e:
-                if e.errno == errno.EAGAIN:
-                    continue
-                raise
-    return nbytes
-
-
-def tcp_recv_file(conn, local_filename, file_size, buffer_size=1024):
+    sock = conn.get_sock()
+    try:
+        if hasattr(filename, "fileno"):  # already-open file object, no reopen
+            return sock.sendfile(filename)
+        with open(filename, "rb") as f:
+            return sock.sendfile(f)
+    except (socket.error, socket.timeout) as e:
+        raise ConnectionError("[-] Error while uploading file(%s)." % (e.args,)) from e
+    except IOError as e:
+        raise DataError("[-] Error while reading local file(%s)." % (e.args,)) from e
+
+
+def tcp_recv_file(conn, local_filename, file_size, buffer_size=65536):
     """
     Receive file from server, fragmented it while receiving and write to disk.
     arguments:
@@ -124,30 +141,32 @@ def tcp_recv_file(conn, local_filename, file_size, buffer_size=1024):
     total_file_size = 0
     flush_size = 0
     remain_bytes = file_size
+    view = memoryview(bytearray(buffer_size))
     with open(local_filename, "wb+") as f:
         while remain_bytes > 0:
             try:
-                if remain_bytes >= buffer_size:
-                    file_buffer, recv_size = tcp_recv_response(
-                        conn, buffer_size, buffer_size
-                    )
-                else:
-                    file_buffer, recv_size = tcp_recv_response(
-                        conn, remain_bytes, buffer_size
-                    )
-                f.write(file_buffer)
-                remain_bytes -= buffer_size
-                total_file_size += recv_size
-                flush_size += recv_size
-                if flush_size >= 4096:
-                    f.flush()
-                    flush_size = 0
-            except ConnectionError as e:
-                msg = "[-] Error: while downloading file(%s)." % e.args
+                recv_size = conn._sock.recv_into(view[: min(remain_bytes, buffer_size)])
+            except (socket.error, socket.timeout) as e:
+                msg = "[-] Error: while downloading file(%s)." % (e.args,)
                 raise ConnectionError(msg) from e
+            if not recv_size:
+                # peer closed mid-body; without this the loop would spin forever
+                msg = (
+                    "[-] Error: connection closed, %d bytes short while downloading file."
+                    % remain_bytes
+                )
+                raise ConnectionError(msg)
+            try:
+                f.write(view[:recv_size])
             except IOError as e:
-                msg = "[-] Error: while writting local file(%s)." % e.args
+                msg = "[-] Error: while writting local file(%s)." % (e.args,)
                 raise DataError(msg) from e
+            remain_bytes -= recv_size
+            total_file_size += recv_size
+            flush_size += recv_size
+            if flush_size >= 4096:
+                f.flush()
+                flush_size = 0
     return total_file_size
 
 
@@ -157,12 +176,26 @@ class StorageClient:
     Note: argument host_tuple of storage server ip address, that should be a single element.
     """
 
-    def __init__(self, host: str, port: int, timeout: int, *args) -> None:
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        timeout: int,
+        *args,
+        max_conn=None,
+        idle_timeout=None,
+        sndbuf=None,
+        rcvbuf=None,
+    ) -> None:
         conn_kwargs = {
             "name": "Storage Pool",
             "host_tuple": (host,),
             "port": port,
             "timeout": timeout,
+            "max_conn": max_conn,
+            "idle_timeout": idle_timeout,
+            "sndbuf": sndbuf,
+            "rcvbuf": rcvbuf,
         }
         self.pool = ConnectionPool(**conn_kwargs)
 
@@ -252,31 +285,34 @@ class StorageClient:
         )
         th.pkg_len += file_size
         th.cmd = cmd
+        if upload_slave:
+            send_buffer = struct.pack(
+                slave_fmt,
+                master_filename_len,
+                file_size,
+                prefix_name,
+                file_ext_name,
+                master_filename,
+            )
+        else:
+            send_buffer = struct.pack(
+                non_slave_fmt,
+                store_serv.store_path_index,
+                file_size,
+                file_ext_name.encode(),
+            )
         with self.pool.open_connection() as store_conn:
-            th.send_header(store_conn)
-            if upload_slave:
-                send_buffer = struct.pack(
-                    slave_fmt,
-                    master_filename_len,
-                    file_size,
-                    prefix_name,
-                    file_ext_name,
-                    master_filename,
-                )
+            if upload_type == FDFS_UPLOAD_BY_BUFFER:
+                # One scatter-gather syscall; the payload is never copied
+                # into a joined header+body buffer
+                tcp_send_datav(store_conn, th.build_header(), send_buffer, file_buffer)
             else:
-                send_buffer = struct.pack(
-                    non_slave_fmt,
-                    store_serv.store_path_index,
-                    file_size,
-                    file_ext_name.encode(),
-                )
-            tcp_send_data(store_conn, send_buffer)
-            if upload_type == FDFS_UPLOAD_BY_FILENAME:
-                send_file_size = tcp_send_file(store_conn, file_buffer)
-            elif upload_type == FDFS_UPLOAD_BY_BUFFER:
-                tcp_send_data(store_conn, file_buffer)
-            elif upload_type == FDFS_UPLOAD_BY_FILE:
-                send_file_size = tcp_send_file_ex(store_conn, file_buffer)
+                th.send_header(store_conn)
+                tcp_send_data(store_conn, send_buffer)
+                if upload_type == FDFS_UPLOAD_BY_FILENAME:
+                    send_file_size = tcp_send_file(store_conn, file_buffer)
+                elif upload_type == FDFS_UPLOAD_BY_FILE:
+                    send_file_size = tcp_send_file_ex(store_conn, file_buffer)
             th.recv_header(store_conn)
             if th.status != 0:
                 msg = "[-] Error: %d, %s" % (th.status, os.strerror(th.status))
@@ -373,16 +409,23 @@ class StorageClient:
         non_slave_fmt = "!B Q %ds" % FDFS_FILE_EXT_NAME_MAX_LEN
         th = TrackerHeader(cmd=STORAGE_PROTO_CMD_UPLOAD_FILE)
         th.pkg_len = struct.calcsize(non_slave_fmt) + file_size
+        send_buffer = struct.pack(
+            non_slave_fmt,
+            store_serv.store_path_index,
+            file_size,
+            file_ext_name.encode(),
+        )
+        # Prebuild the request before connecting, so the socket round-trip is
+        # connect -> send(s) -> recv with no packing work in between.
+        # Coalesce header + metadata + body into one send to cut syscalls;
+        # large bodies go out as-is to avoid copying them into a joined buffer.
+        if file_size > COALESCE_MAX_SIZE:
+            requests = (th.build_header() + send_buffer, file_buffer)
+        else:
+            requests = (b"".join((th.build_header(), send_buffer, file_buffer)),)
         async with store_serv.connect_tcp() as client:
-            await client.send(th.build_header())
-            send_buffer = struct.pack(
-                non_slave_fmt,
-                store_serv.store_path_index,
-                file_size,
-                file_ext_name.encode(),
-            )
-            await client.send(send_buffer)
-            await client.send(file_buffer)
+            for request in requests:
+                await client.send(request)
             await th.verify_header(client)
             recv_buffer = await tcp_receive(
                 client, th.pkg_len, FDFS_GROUP_NAME_MAX_LEN, operator.gt, "Storage"
@@ -565,12 +608,11 @@ class StorageClient:
         th.pkg_len = FDFS_GROUP_NAME_MAX_LEN + file_name_len
         if isinstance(remote_filename, str):
             remote_filename = remote_filename.encode()
+        # del_fmt: |-group_name(16)-filename(len)-|
+        del_fmt = "!%ds %ds" % (FDFS_GROUP_NAME_MAX_LEN, file_name_len)
+        send_buffer = struct.pack(del_fmt, store_serv.group_name, remote_filename)
         async with store_serv.connect_tcp() as client:
-            await client.send(th.build_header())
-            # del_fmt: |-group_name(16)-filename(len)-|
-            del_fmt = "!%ds %ds" % (FDFS_GROUP_NAME_MAX_LEN, file_name_len)
-            send_buffer = struct.pack(del_fmt, store_serv.group_name, remote_filename)
-            await client.send(send_buffer)
+            await client.send(th.build_header() + send_buffer)
             await th.verify_header(client)
         if isinstance(store_serv.group_name, str):
             group = store_serv.group_name.encode()
@@ -579,6 +621,86 @@ class StorageClient:
         remote_file_id = group + b"/" + cast(bytes, remote_filename)
         return "Delete file successed.", remote_file_id, store_serv.ip_addr
 
+    async def modify_buffer(
+        self,
+        store_serv: StorageServer,
+        appender_filename: str | bytes,
+        file_buffer: bytes,
+        offset: int = 0,
+    ) -> dict:
+        """
+        Modify an appender file on storage server with a buffer.
+        """
+        th = TrackerHeader(cmd=STORAGE_PROTO_CMD_MODIFY_FILE)
+        if isinstance(appender_filename, str):
+            appender_filename = appender_filename.encode()
+        appender_filename_len = len(appender_filename)
+        file_size = len(file_buffer)
+        th.pkg_len = FDFS_PROTO_PKG_LEN_SIZE * 3 + appender_filename_len + file_size
+        # modify_fmt: |-filename_len(8)-offset(8)-filesize(8)-filename(len)-|
+        modify_fmt = "!Q Q Q %ds" % appender_filename_len
+        send_buffer = struct.pack(
+            modify_fmt, appender_filename_len, offset, file_size, appender_filename
+        )
+        if file_size > COALESCE_MAX_SIZE:
+            requests = (th.build_header() + send_buffer, file_buffer)
+        else:
+            requests = (b"".join((th.build_header(), send_buffer, file_buffer)),)
+        async with store_serv.connect_tcp() as client:
+            for request in requests:
+                await client.send(request)
+            await th.verify_header(client)
+        return {"Status": "Modify successed.", "Storage IP": store_serv.ip_addr}
+
+    async def download_file(
+        self,
+        store_serv: StorageServer,
+        remote_filename: str | bytes,
+        local_filename: str,
+        offset: int = 0,
+        download_bytes: int = 0,
+        buffer_size: int = 4096,
+    ) -> dict:
+        """
+        Download file from storage server to a local file.
+        Chunks are written through anyio's async file API, so disk writes run
+        in a worker thread and don't block the event loop between receives.
+        """
+        th = TrackerHeader(cmd=STORAGE_PROTO_CMD_DOWNLOAD_FILE)
+        if isinstance(remote_filename, str):
+            remote_filename = remote_filename.encode()
+        if isinstance(group_name := store_serv.group_name, str):
+            group_name = group_name.encode()  # type:ignore[assignment]
+        remote_filename_len = len(remote_filename)
+        th.pkg_len = (
+            FDFS_PROTO_PKG_LEN_SIZE * 2 + FDFS_GROUP_NAME_MAX_LEN + remote_filename_len
+        )
+        # down_fmt: |-offset(8)-download_bytes(8)-group_name(16)-remote_filename(len)-|
+        down_fmt = "!Q Q %ds %ds" % (FDFS_GROUP_NAME_MAX_LEN, remote_filename_len)
+        send_buffer = struct.pack(
+            down_fmt, offset, download_bytes, group_name, remote_filename
+        )
+        total_recv_size = 0
+        async with store_serv.connect_tcp() as client:
+            await client.send(th.build_header() + send_buffer)
+            await th.verify_header(client)
+            remain_bytes = th.pkg_len
+            async with await anyio.open_file(local_filename, "wb") as f:
+                while remain_bytes > 0:
+                    chunk = await client.receive(min(remain_bytes, buffer_size))
+                    await f.write(chunk)
+                    length = len(chunk)
+                    remain_bytes -= length
+                    total_recv_size += length
+        ret_dic = {
+            "Remote file_id": group_name + b"/" + cast(bytes, remote_filename),
+            "Content": local_filename,
+            "Download size": appromix(total_recv_size),
+            "Storage IP": store_serv.ip_addr,
+        }
+        self._auto_decode_bytes(ret_dic)
+        return ret_dic
+
     def storage_delete_file(self, tracker_client, store_serv, remote_filename):
         """
         Delete file from storage server.
@@ -654,7 +776,23 @@ class StorageClient:
             if download_type == FDFS_DOWNLOAD_TO_FILE:
                 total_recv_size = tcp_recv_file(store_conn, file_buffer, th.pkg_len)
             elif download_type == FDFS_DOWNLOAD_TO_BUFFER:
-                recv_buffer, total_recv_size = tcp_recv_response(store_conn, th.pkg_len)
+                if file_buffer is not None and len(file_buffer) >= th.pkg_len:
+                    # caller preallocated the receive buffer: fill it in
+                    # place instead of collecting chunks and joining them
+                    total_recv_size = tcp_recv_into(
+                        store_conn, memoryview(file_buffer)[: th.pkg_len]
+                    )
+                    # a shorter body than the preallocation must not leak
+                    # the zero padding past total_recv_size to the caller
+                    recv_buffer = (
+                        file_buffer
+                        if total_recv_size == len(file_buffer)
+                        else memoryview(file_buffer)[:total_recv_size]
+                    )
+                else:
+                    recv_buffer, total_recv_size = tcp_recv_response(
+                        store_conn, th.pkg_len
+                    )
         finally:
             self.pool.release(store_conn)
         ret_dic = {
@@ -717,8 +855,11 @@ class StorageClient:
     ):
         ret = 0
         conn = self.pool.get_connection()
+        op_flag = _META_OP_FLAGS.get(op_flag, op_flag)
+        if isinstance(remote_filename, str):
+            remote_filename = remote_filename.encode()
         remote_filename_len = len(remote_filename)
-        meta_buffer = fdfs_pack_metadata(meta_dict)
+        meta_buffer = fdfs_pack_metadata(meta_dict).encode()
         meta_len = len(meta_buffer)
         th = TrackerHeader()
         th.pkg_len = (
@@ -924,20 +1065,29 @@ class StorageClient:
         appender_filename_len = len(appender_filename)
         th.pkg_len = FDFS_PROTO_PKG_LEN_SIZE * 3 + appender_filename_len + filesize
         try:
-            th.send_header(store_conn)
             # modify_fmt: |-filename_len(8)-offset(8)-filesize(8)-filename(len)-|
             modify_fmt = "!Q Q Q %ds" % appender_filename_len
             send_buffer = struct.pack(
                 modify_fmt, appender_filename_len, offset, filesize, appender_filename
             )
-            tcp_send_data(store_conn, send_buffer)
-            if upload_type == FDFS_UPLOAD_BY_FILENAME:
-                upload_size = tcp_send_file(store_conn, filebuffer)
-            elif upload_type == FDFS_UPLOAD_BY_BUFFER:
-                tcp_send_data(store_conn, filebuffer)
-            elif upload_type == FDFS_UPLOAD_BY_FILE:
-                upload_size = tcp_send_file_ex(store_conn, filebuffer)
-                logger.debug(f"{upload_size = }")
+            if upload_type == FDFS_UPLOAD_BY_BUFFER:
+                # One scatter-gather syscall, no copy of the payload; works
+                # for bytes, bytearray and memoryview alike
+                tcp_send_datav(store_conn, th.build_header(), send_buffer, filebuffer)
+            else:
+                # Header and metadata are tiny; pair them in one sendmsg so
+                # the sendfile'd body is the only other syscall
+                tcp_send_datav(store_conn, th.build_header(), send_buffer)
+                if upload_type == FDFS_UPLOAD_BY_FILENAME:
+                    # Splice the file from page cache to socket via sendfile;
+                    # only Windows lacks it and keeps the read+send loop
+                    if sys.platform.lower().startswith("win"):
+                        upload_size = tcp_send_file(store_conn, filebuffer)
+                    else:
+                        upload_size = tcp_send_file_ex(store_conn, filebuffer)
+                elif upload_type == FDFS_UPLOAD_BY_FILE:
+                    upload_size = tcp_send_file_ex(store_conn, filebuffer)
+                    logger.debug(f"{upload_size = }")
             th.recv_header(store_conn)
             if th.status != 0:
                 raise DataError(
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import os
 import struct
 from dataclasses import dataclass
@@ -583,13 +585,14 @@ class TrackerClient:
 
     @staticmethod
     async def get_storage_server(
-        host_info: tuple[str, int], group_name="", filename=""
+        host_info: tuple[str, int], group_name="", filename="", cmd: int | None = None
     ) -> StorageServer:
         """Query storage server for upload, without group name.
         Return: StorageServer object"""
         pkg_len = file_name_len = len(filename)
-        if is_delete := bool(file_name_len):
-            cmd = TRACKER_PROTO_CMD_SERVICE_QUERY_UPDATE
+        if with_filename := bool(file_name_len):
+            if cmd is None:
+                cmd = TRACKER_PROTO_CMD_SERVICE_QUERY_UPDATE
             pkg_len += FDFS_GROUP_NAME_MAX_LEN
         else:
             cmd = TRACKER_PROTO_CMD_SERVICE_QUERY_STORE_WITHOUT_GROUP_ONE
@@ -600,20 +603,21 @@ class TrackerClient:
             raise FDFSError(
                 "'anyio' is required! You may need to run: `pip install anyio`"
             ) from None
+        send_buffer = th.build_header()
+        expected_len = TRACKER_QUERY_STORAGE_STORE_BODY_LEN
+        if with_filename:
+            expected_len = TRACKER_QUERY_STORAGE_FETCH_BODY_LEN
+            # query_fmt: |-group_name(16)-filename(file_name_len)-|
+            query_fmt = "!%ds %ds" % (FDFS_GROUP_NAME_MAX_LEN, file_name_len)
+            send_buffer += struct.pack(
+                query_fmt, group_name.encode(), filename.encode()
+            )
         async with await connection as client:
-            await client.send(th.build_header())
-            expected_len = TRACKER_QUERY_STORAGE_STORE_BODY_LEN
-            if is_delete:
-                expected_len = TRACKER_QUERY_STORAGE_FETCH_BODY_LEN
-                # query_fmt: |-group_name(16)-filename(file_name_len)-|
-                query_fmt = "!%ds %ds" % (FDFS_GROUP_NAME_MAX_LEN, file_name_len)
-                send_buffer = struct.pack(
-                    query_fmt, group_name.encode(), filename.encode()
-                )
-                await client.send(send_buffer)
+            # Single send for header (+ optional query body) to avoid two segments
+            await client.send(send_buffer)
             await th.verify_header(client)
             recv_buffer = await tcp_receive(client, th.pkg_len, expected_len)
-        if is_delete:
+        if with_filename:
             # recv_fmt: |-group_name(16)-ip_addr(16)-port(8)-|
             recv_fmt = "!%ds %ds Q" % (FDFS_GROUP_NAME_MAX_LEN, IP_ADDRESS_SIZE - 1)
             group, ip, port = struct.unpack(recv_fmt, recv_buffer)
@@ -9,6 +9,7 @@ import os
 import platform
 import stat
 from configparser import RawConfigParser
+from functools import lru_cache
 
 from .exceptions import MissingSectionHeaderError, ParsingError
 
@@ -27,6 +28,13 @@ def appromix(size: int | float, base=0) -> str:
     multiples = 1024
     if size < 0:
         raise ValueError("[-] Error: number must be non-negative.")
+    if isinstance(size, int):
+        # pick the bucket from the bit length: constant time, no
+        # divide-per-suffix loop
+        index = base + (size.bit_length() - 1) // 10 if size else base
+        if index >= len(SUFFIX):
+            raise ValueError("[-] Error: number too big.")
+        return "{0:.2f}{1}".format(size / (1 << 10 * (index - base)), SUFFIX[index])
     for suffix in SUFFIX[base:]:
         if size < multiples:
             return "{0:.2f}{1}".format(size, suffix)
@@ -35,12 +43,16 @@ def appromix(size: int | float, base=0) -> str:
 
 
 def get_file_ext_name(filename: str, double_ext=True) -> str:
-    li = filename.split(os.extsep)
-    if len(li) <= 1 or __os_sep__ in li[-1]:
+    # rfind slices instead of splitting the whole path into a list:
+    # one small allocation for the returned extension, nothing else
+    dot = filename.rfind(os.extsep)
+    if dot == -1 or __os_sep__ in filename[dot + 1 :]:
         return ""
-    if double_ext and len(li) > 2 and __os_sep__ not in li[-2]:
-        return "%s.%s" % (li[-2], li[-1])
-    return li[-1]
+    if double_ext:
+        prev_dot = filename.rfind(os.extsep, 0, dot)
+        if prev_dot != -1 and __os_sep__ not in filename[prev_dot + 1 : dot]:
+            return filename[prev_dot + 1 :]
+    return filename[dot + 1 :]
 
 
 class FastdfsConfigParser(RawConfigParser):
@@ -209,32 +221,40 @@ class FastdfsConfigParser(RawConfigParser):
             raise e
 
 
+@lru_cache(maxsize=1024)
 def split_remote_fileid(remote_file_id: str, maybe_url=True) -> tuple[str, str] | None:
     """
     Splite remote_file_id to (group_name, remote_file_name)
     arguments:
         @remote_file_id: string
     @return tuple, (group_name, remote_file_name)
+
+    The result is cached: flows like upload-then-delete or repeated ops on
+    the same file id parse the string only once.
     """
-    if maybe_url and (sep := "://") in remote_file_id:
-        remote_file_id = remote_file_id.split(sep)[-1].split("/", 1)[-1]
-    try:
-        group_name, remote_file_name = remote_file_id.split("/", 1)
-    except ValueError:
+    # partition never allocates an intermediate list the way split does
+    if maybe_url:
+        _, scheme_sep, tail = remote_file_id.partition("://")
+        if scheme_sep:
+            remote_file_id = tail.partition("/")[2]
+    group_name, sep, remote_file_name = remote_file_id.partition("/")
+    if not sep:
         return None
     return group_name, remote_file_name
 
 
-def fdfs_check_file(filename: str) -> tuple[bool, str]:
-    ret = True
-    errmsg = ""
-    if not os.path.isfile(filename):
-        ret = False
-        errmsg = "[-] Error: %s is not a file." % filename
-    elif not stat.S_ISREG(os.stat(filename).st_mode):
-        ret = False
-        errmsg = "[-] Error: %s is not a regular file." % filename
-    return (ret, errmsg)
+def fdfs_check_file(filename: str) -> tuple[int | None, str]:
+    """Check that filename is a regular file, with one metadata syscall.
+
+    @return tuple, (file size, '') if valid else (None, error message)
+    """
+    try:
+        st = os.stat(filename)
+    except OSError:
+        return (None, "[-] Error: %s is not a file." % filename)
+    if not stat.S_ISREG(st.st_mode):
+        return (None, "[-] Error: %s is not a regular file." % filename)
+    return (st.st_size, "")
 
 
 def _test() -> None:
@@ -2,10 +2,16 @@
 import os
 import sys
 import time
+import types
 
 from fastdfs_client.client import *
 from fastdfs_client.exceptions import *
 
+try:
+    import anyio
+except ImportError:
+    anyio = None  # type:ignore[assignment]
+
 
 def usage() -> None:
     print(
@@ -30,16 +36,28 @@ def usage() -> None:
         "\ttruncate {truncate_filesize} {remote_fileid}\n"
         "\tmodifyfile {local_filename} {remote_fileid} {file_offset}\n"
         "\tmodifybuffer {local_filename} {remote_fileid} {file_offset}\n"
+        "\tbatchup {local_filename} [...] [--concurrency N]\n"
+        "\tbatchdel {remote_fileid} [...]\n"
         "e.g.: python fdfs_test.py upfile test"
     )
     print(s)
 
 
-if len(sys.argv) < 2:
-    usage()
-
 client = FastdfsClient("client.conf")
 
+# Buffer-mode commands slurp the whole file into RAM before sending.  Above
+# this size the handlers route to the *_by_file variants instead, which
+# stream from disk (sendfile) without materializing the payload.
+STREAM_THRESHOLD = 1 << 20
+
+
+def read_small_file(local_filename):
+    """Return the file bytes, or None when the file is big enough to stream."""
+    if os.stat(local_filename).st_size >= STREAM_THRESHOLD:
+        return None
+    with open(local_filename, "rb") as f:
+        return f.read()
+
 
 def upfile_func():
     # Upload by filename
@@ -52,12 +70,12 @@ def upfile_func():
         file_size = os.stat(local_filename).st_size
         # meta_buffer can be null.
         meta_dict = {"ext_name": "py", "file_size": str(file_size) + "B"}
-        t1 = time.time()
+        t1 = time.perf_counter_ns()
         ret_dict = client.upload_by_filename(local_filename, meta_dict)
-        t2 = time.time()
+        elapsed = (time.perf_counter_ns() - t1) / 1e9
         for key in ret_dict:
             print("[+] %s : %s" % (key, ret_dict[key]))
-        print("[+] time consume: %fs" % (t2 - t1))
+        print("[+] time consume: %fs" % elapsed)
     except (ConnectionError, ResponseError, DataError) as e:
         print(e)
 
@@ -70,12 +88,12 @@ def upfileex_func():
         return None
     try:
         local_filename = sys.argv[2]
-        t1 = time.time()
+        t1 = time.perf_counter_ns()
         ret_dict = client.upload_by_file(local_filename)
-        t2 = time.time()
+        elapsed = (time.perf_counter_ns() - t1) / 1e9
         for key in ret_dict:
             print("[+] %s : %s" % (key, ret_dict[key]))
-        print("[+] time consume: %fs" % (t2 - t1))
+        print("[+] time consume: %fs" % elapsed)
     except (ConnectionError, ResponseError, DataError) as e:
         print(e)
 
@@ -109,8 +127,12 @@ def upslavebuffer_func():
         local_filename = sys.argv[2]
         remote_fileid = sys.argv[3]
         prefix_name = sys.argv[4]
-        with open(local_filename, "rb") as f:
-            filebuffer = f.read()
+        filebuffer = read_small_file(local_filename)
+        if filebuffer is None:
+            ret_dict = client.upload_slave_by_file(
+                local_filename, remote_fileid, prefix_name
+            )
+        else:
             ret_dict = client.upload_slave_by_buffer(
                 filebuffer, remote_fileid, prefix_name
             )
@@ -219,11 +241,13 @@ def upbuffer_func():
     # meta_buffer can be null.
     meta_buffer = {"ext_name": "gif", "width": "150px", "height": "80px"}
     try:
-        with open(local_filename, "rb") as f:
-            file_buffer = f.read()
+        file_buffer = read_small_file(local_filename)
+        if file_buffer is None:
+            ret_dict = client.upload_by_file(local_filename, meta_buffer)
+        else:
             ret_dict = client.upload_by_buffer(file_buffer, ext_name, meta_buffer)
-            for key in ret_dict:
-                print("[+] %s : %s" % (key, ret_dict[key]))
+        for key in ret_dict:
+            print("[+] %s : %s" % (key, ret_dict[key]))
     except (ConnectionError, ResponseError, DataError) as e:
         print(e)
 
@@ -301,8 +325,10 @@ def upappendbuffer_func():
         return None
     local_filename = sys.argv[2]
     try:
-        with open(local_filename, "rb") as f:
-            file_buffer = f.read()
+        file_buffer = read_small_file(local_filename)
+        if file_buffer is None:
+            ret_dict = client.upload_appender_by_file(local_filename)
+        else:
             ret_dict = client.upload_appender_by_buffer(file_buffer)
         for key in ret_dict:
             print("[+] %s : %s" % (key, ret_dict[key]))
@@ -335,11 +361,13 @@ def appendbuffer_func():
     local_filename = sys.argv[2]
     remote_fileid = sys.argv[3]
     try:
-        with open(local_filename, "rb") as f:
-            filebuffer = f.read()
+        filebuffer = read_small_file(local_filename)
+        if filebuffer is None:
+            ret_dict = client.append_by_file(local_filename, remote_fileid)
+        else:
             ret_dict = client.append_by_buffer(filebuffer, remote_fileid)
-            for key in ret_dict:
-                print("[+] %s : %s" % (key, ret_dict[key]))
+        for key in ret_dict:
+            print("[+] %s : %s" % (key, ret_dict[key]))
     except (ConnectionError, ResponseError, DataError) as e:
         print(e)
 
@@ -391,44 +419,105 @@ def modifybuffer_func():
     if len(sys.argv) > 4:
         file_offset = int(sys.argv[4])
     try:
-        with open(local_filename, "rb") as f:
-            filebuffer = f.read()
-        ret_dict = client.modify_by_buffer(filebuffer, remote_fileid, file_offset)
+        filebuffer = read_small_file(local_filename)
+        if filebuffer is None:
+            ret_dict = client.modify_by_file(local_filename, remote_fileid, file_offset)
+        else:
+            ret_dict = client.modify_by_buffer(filebuffer, remote_fileid, file_offset)
         for key in ret_dict:
             print("[+] %s : %s" % (key, ret_dict[key]))
     except (ConnectionError, ResponseError, DataError) as e:
         print(e)
 
 
-command_function = {
-    "upfile": upfile_func,
-    "upfileex": upfileex_func,
-    "upbuffer": upbuffer_func,
-    "delete": del_func,
-    "downfile": downfile_func,
-    "downbuffer": downbuffer_func,
-    "listgroup": list_group_func,
-    "listall": listall_func,
-    "listsrv": list_server_func,
-    "getmeta": get_meta_data_func,
-    "setmeta": set_meta_data_func,
-    "upslavefile": upslavefile_func,
-    "upappendfile": upappendfile_func,
-    "upappendbuffer": upappendbuffer_func,
-    "appendfile": appendfile_func,
-    "appendbuffer": appendbuffer_func,
-    "truncate": truncate_func,
-    "modifyfile": modifyfile_func,
-    "modifybuffer": modifybuffer_func,
-    "-h": usage,
-}
+def _pop_concurrency(args, default=16):
+    """Strip '--concurrency N' out of args and return (value, rest)."""
+    if "--concurrency" not in args:
+        return default, args
+    index = args.index("--concurrency")
+    try:
+        value = int(args[index + 1])
+    except (IndexError, ValueError):
+        return None, args
+    return value, args[:index] + args[index + 2 :]
+
+
+def batchup_func():
+    # Upload many local files concurrently over one shared pool
+    # usage: python fdfs_test.py batchup {local_filename} [...] [--concurrency N]
+    if anyio is None:
+        print("[-] Error: anyio is required for batch commands.")
+        return None
+    concurrency, paths = _pop_concurrency(sys.argv[2:])
+    if concurrency is None or not paths:
+        usage()
+        return None
+    try:
+        urls = anyio.run(client.upload_paths, paths, concurrency)
+    except (ConnectionError, ResponseError, DataError) as e:
+        print(e)
+        return None
+    for path, url in zip(paths, urls):
+        print("[+] %s : %s" % (path, url))
+
+
+def batchdel_func():
+    # Delete many remote files concurrently
+    # usage: python fdfs_test.py batchdel {remote_fileid} [...]
+    if anyio is None:
+        print("[-] Error: anyio is required for batch commands.")
+        return None
+    file_ids = sys.argv[2:]
+    if not file_ids:
+        usage()
+        return None
+    try:
+        results = anyio.run(client.delete_many, file_ids)
+    except (ConnectionError, ResponseError, DataError) as e:
+        print(e)
+        return None
+    for file_id, ret_tuple in zip(file_ids, results):
+        print("[+] %s : %s" % (file_id, ret_tuple and ret_tuple[0]))
+
+
+# Read-only dispatch table, built once at import
+command_function = types.MappingProxyType(
+    {
+        "upfile": upfile_func,
+        "upfileex": upfileex_func,
+        "upbuffer": upbuffer_func,
+        "delete": del_func,
+        "downfile": downfile_func,
+        "downbuffer": downbuffer_func,
+        "listgroup": list_group_func,
+        "listall": listall_func,
+        "listsrv": list_server_func,
+        "getmeta": get_meta_data_func,
+        "setmeta": set_meta_data_func,
+        "upslavefile": upslavefile_func,
+        "upappendfile": upappendfile_func,
+        "upappendbuffer": upappendbuffer_func,
+        "appendfile": appendfile_func,
+        "appendbuffer": appendbuffer_func,
+        "truncate": truncate_func,
+        "modifyfile": modifyfile_func,
+        "modifybuffer": modifybuffer_func,
+        "batchup": batchup_func,
+        "batchdel": batchdel_func,
+        "-h": usage,
+    }
+)
 
 
 def main() -> int:
     if not sys.argv[1:]:
         usage()
         return 1
-    command_function[sys.argv[1].lower()]
+    fn = command_function.get(sys.argv[1].lower())
+    if fn is None:
+        usage()
+        return 1
+    fn()
     return 0
 
 
@@ -1,51 +1,57 @@
 #!/usr/bin/env python
 import os
-import shlex
 import subprocess
 import sys
 import time
 from pathlib import Path
 
 TOOL = ("poetry", "pdm", "")[0]
-work_dir = Path(__file__).parent.resolve().parent
+# abspath/dirname are pure string ops, unlike resolve() which walks the
+# path with a readlink per component; same computation as check.py
+work_dir = Path(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 if Path.cwd() != work_dir:
     os.chdir(str(work_dir))
 
-CMD = "coverage run -m pytest -s tests"
-COMBINE = "coverage combine .coverage*"
-REPORT = 'coverage report --omit="tests/*" -m'
-
-
-def remove_outdate_files(start_time: float) -> None:
-    for file in work_dir.glob(".coverage*"):
-        if file.stat().st_mtime < start_time:
-            file.unlink()
-            print(f"Removed outdate file: {file}")
-
-
-def run_command(cmd: str, shell=False, tool=TOOL) -> None:
-    prefix = tool + " run "
-    if tool and not cmd.startswith(prefix):
-        cmd = prefix + cmd
-    print("-->", cmd, flush=True)
-    r = subprocess.run(cmd if shell else shlex.split(cmd), shell=shell)
+CMD = ["coverage", "run", "-m", "pytest", "-s", "tests"]
+REPORT = ["coverage", "report", "--omit=tests/*", "-m"]
+
+
+def scan_coverage_files(start_time: float) -> list:
+    """One directory pass: unlink stale fragments, return the fresh ones.
+
+    DirEntry caches the stat from the scandir walk, so this replaces the
+    two glob passes (each stat-ing every match) with a single read.
+    """
+    fresh = []
+    with os.scandir(work_dir) as it:
+        for entry in it:
+            if not entry.name.startswith(".coverage"):
+                continue
+            if entry.stat().st_mtime < start_time:
+                os.unlink(entry.path)
+                print(f"Removed outdate file: {entry.path}")
+            elif entry.name.startswith(".coverage."):
+                fresh.append(entry.name)
+    return fresh
+
+
+def run_command(cmd: list, tool=TOOL) -> None:
+    if tool and cmd[:2] != [tool, "run"]:
+        cmd = [tool, "run", *cmd]
+    print("-->", " ".join(cmd), flush=True)
+    r = subprocess.run(cmd)
     r.returncode and sys.exit(1)
 
 
-def combine_result_files(shell=COMBINE) -> None:
-    to_be_combine = [i.name for i in work_dir.glob(".coverage.*")]
+def combine_result_files(to_be_combine: list) -> None:
     if to_be_combine:
-        if sys.platform == "win32":
-            if work_dir.joinpath(".coverage").exists():
-                shell = shell.replace("*", " ")
-            else:
-                shell = shell.replace(".coverage*", "")
-            shell += " ".join(to_be_combine)
-        run_command(shell, True)
+        # explicit file list: no shell, no glob, identical on Windows
+        if work_dir.joinpath(".coverage").exists():
+            to_be_combine = [".coverage", *to_be_combine]
+        run_command(["coverage", "combine", *to_be_combine])
 
 
 started_at = time.time()
 run_command(CMD)
-remove_outdate_files(started_at)
-combine_result_files()
+combine_result_files(scan_coverage_files(started_at))
 run_command(REPORT)
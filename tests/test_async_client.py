@@ -1,3 +1,4 @@
+import logging
 from pathlib import Path
 
 import httpx
@@ -5,51 +6,61 @@ import pytest
 
 from fastdfs_client.client import AsyncDfsClient, FastdfsClient
 
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture(scope="module")
+def file_bytes() -> bytes:
+    # Read this file once for the whole module instead of per test
+    return Path(__file__).read_bytes()
+
+
+@pytest.fixture(scope="module")
+async def http_client():
+    # One pooled httpx client per backend run, so the verification GETs
+    # reuse the TLS connection instead of handshaking per test
+    async with httpx.AsyncClient() as client:
+        yield client
+
 
 class TestUpload:
     client_cls = AsyncDfsClient
     domain = "dfs.waketzheng.top"
 
     @pytest.mark.anyio
-    async def test_upload_and_delete(self):
+    async def test_upload_and_delete(self, file_bytes, http_client):
         to_upload = Path(__file__)
         client = self.client_cls([self.domain])
-        content = to_upload.read_bytes()
+        content = file_bytes
         url = await client.upload(content, to_upload.suffix)
-        print(f"{url = }")
+        logger.debug("url = %s", url)
         try:
-            uploaded = await self.http_get(url)
+            uploaded = (await http_client.get(url)).content
         finally:
             r = await client.delete(url)
         assert Path(url).suffix == to_upload.suffix
         assert self.domain in url
         assert url.startswith("https")
         assert "success" in str(r)
-        print(f"Success to delete remote file: {Path(url).name}")
+        logger.debug("Success to delete remote file: %s", Path(url).name)
         assert uploaded == content
 
-    @staticmethod
-    async def http_get(url) -> bytes:
-        async with httpx.AsyncClient() as client:
-            r = await client.get(url)
-            return r.content
-
     @pytest.mark.anyio
-    async def test_client_with_ip_mapping(self):
+    async def test_client_with_ip_mapping(self, file_bytes, http_client):
         remote_ip = FastdfsClient.get_domain_ip(self.domain)
         client = self.client_cls([remote_ip], ip_mapping={remote_ip: self.domain})
-        content = Path(__file__).read_bytes() * 2
+        content = file_bytes * 2
         url = await client.upload(content)
-        print(f"{url = }")
+        logger.debug("url = %s", url)
         try:
-            uploaded = await self.http_get(url)
+            uploaded = (await http_client.get(url)).content
         finally:
             r = await client.delete(url)
         assert url.endswith(".jpg")
         assert self.domain in url
         assert url.startswith("https")
         assert "success" in str(r)
-        print(f"Success to delete remote file: {Path(url).name}")
+        logger.debug("Success to delete remote file: %s", Path(url).name)
         assert uploaded == content
 
 
@@ -5,8 +5,20 @@ from typing import Generator
 import pytest
 
 from fastdfs_client.client import Config, FastdfsClient, get_tracker_conf, is_IPv4
+from fastdfs_client.connection import PoolConfig
 from fastdfs_client.exceptions import ConfigError, DataError
 
+# This file doubles as the upload payload in several tests; read it once
+# at import instead of per test.
+_SRC_BYTES = Path(__file__).read_bytes()
+
+
+@pytest.fixture(scope="session")
+def client() -> FastdfsClient:
+    # One pooled client shared by the network tests: the tracker conf is
+    # parsed once and pooled connections are reused across tests
+    return FastdfsClient(["dfs.waketzheng.top"])
+
 
 def test_ip():
     assert is_IPv4("8.8.8.8")
@@ -24,6 +36,13 @@ def test_config_create():
         "timeout": Config.timeout,
         "name": Config.name,
     }
+    assert Config.create((ip + ":23000",)) == {
+        "host_tuple": (ip,),
+        "port": 23000,
+        "timeout": Config.timeout,
+        "name": Config.name,
+    }
+    assert FastdfsClient([ip + ":23000"]).trackers["port"] == 23000
 
 
 def test_conf_file():
@@ -44,6 +63,43 @@ def test_conf_file():
         FastdfsClient(invalid_conf_file)
 
 
+def test_pool_config():
+    ip = "192.168.0.2"
+    client = FastdfsClient((ip,))
+    assert client.tracker_pool.idle_timeout is None
+    conf = PoolConfig(max_size=3, idle_timeout=60, connect_timeout=5, sndbuf=1 << 20)
+    client2 = FastdfsClient((ip,), pool_config=conf)
+    assert client2.tracker_pool.max_conn == 3
+    assert client2.tracker_pool.idle_timeout == 60
+    assert client2.tracker_pool.conn_kwargs["timeout"] == 5
+    assert client2.tracker_pool.conn_kwargs["sndbuf"] == 1 << 20
+    from fastdfs_client.protols import StorageServer
+
+    store = client2._get_store(StorageServer(ip_addr="192.168.0.3", port=23000))
+    assert store.pool.conn_kwargs["sndbuf"] == 1 << 20
+
+
+def test_storage_client_cache():
+    from fastdfs_client.protols import StorageServer
+
+    client = FastdfsClient(("192.168.0.2",))
+    serv = StorageServer(ip_addr="192.168.0.3", port=23000)
+    store = client._get_store(serv)
+    assert client._get_store(serv) is store
+    assert (
+        client._get_store(StorageServer(ip_addr="192.168.0.4", port=23000)) is not store
+    )
+
+
+def test_context_manager():
+    from fastdfs_client.protols import StorageServer
+
+    with FastdfsClient(("192.168.0.2",)) as client:
+        client._get_store(StorageServer(ip_addr="192.168.0.3", port=23000))
+        assert client._storage_clients
+    assert not client._storage_clients
+
+
 def test_conf_string_and_dict():
     conf = {
         "host_tuple": ("192.168.0.2",),
@@ -61,6 +117,30 @@ def test_conf_string_and_dict():
         FastdfsClient({})
 
 
+def test_file_id_from_url():
+    file_id = "group1/M00/00/00/eE0vIWZEgMCAFnaMAAABXbxaFk89563.jpeg"
+    assert FastdfsClient.file_id_from_url(f"https://example.com/{file_id}") == file_id
+    assert FastdfsClient.file_id_from_url(f"http://120.77.47.33/{file_id}") == file_id
+    assert FastdfsClient.file_id_from_url(file_id) == file_id
+
+
+def test_domain_ip_cache(monkeypatch):
+    import fastdfs_client.client as client_module
+
+    calls = []
+
+    def fake_gethostbyname(domain):
+        calls.append(domain)
+        return "1.2.3.4"
+
+    monkeypatch.setattr(client_module.socket, "gethostbyname", fake_gethostbyname)
+    client_module._domain_ip_cache.clear()
+    assert FastdfsClient.get_domain_ip("example.com") == "1.2.3.4"
+    assert FastdfsClient.get_domain_ip("example.com") == "1.2.3.4"
+    assert calls == ["example.com"]
+    client_module._domain_ip_cache.clear()
+
+
 def test_build_host():
     domain = "dfs.waketzheng.top"
     ip = "120.77.47.33"
@@ -78,11 +158,10 @@ def test_build_host():
     assert client6._build_host(ip) == f"https://{domain}/"
 
 
-def test_upload_url():
+def test_upload_url(client):
     to_upload = Path(__file__)
     domain = "dfs.waketzheng.top"
-    client = FastdfsClient([domain])
-    url = client.upload_as_url(to_upload.read_bytes(), to_upload.suffix)
+    url = client.upload_as_url(_SRC_BYTES, to_upload.suffix)
     r = client.delete_file(url)
     assert Path(url).suffix == to_upload.suffix
     assert domain in url
@@ -92,9 +171,7 @@ def test_upload_url():
         client._check_file(str(to_upload.parent))
 
 
-def test_upload_filename():
-    domain = "dfs.waketzheng.top"
-    client = FastdfsClient([domain])
+def test_upload_filename(client):
     ret = client.upload_by_filename(__file__)
     remote_file_id = ret["Remote file_id"]
     r = client.delete_file(remote_file_id)
@@ -105,11 +182,13 @@ def test_upload_filename():
         client.upload_by_filename(str(Path(__file__).parent))
 
 
-def test_upload_file():
-    domain = "dfs.waketzheng.top"
-    client = FastdfsClient([domain])
-    with pytest.raises(NotImplementedError):
-        client.upload_by_file(__file__)
+def test_upload_file(client):
+    ret = client.upload_by_file(__file__)
+    remote_file_id = ret["Remote file_id"]
+    r = client.delete_file(remote_file_id)
+    assert ret["Group name"].startswith("group")
+    assert remote_file_id in str(r)
+    assert ret["Local file name"] in __file__
 
 
 @contextmanager
@@ -127,9 +206,7 @@ def temp_remote_file(
         client.delete_file(url)
 
 
-def test_download(tmp_path: Path):
-    domain = "dfs.waketzheng.top"
-    client = FastdfsClient([domain])
+def test_download(client, tmp_path: Path):
     with pytest.raises(DataError):
         client.download_to_file(tmp_path / "localfile", "not-exist-remote-file-id")
     to_upload = Path(__file__)
@@ -137,19 +214,17 @@ def test_download(tmp_path: Path):
     with temp_remote_file(client, to_upload) as remote_file_id:
         r = client.download_to_file(temp_file, remote_file_id)
     assert r["Content"] == temp_file
-    assert temp_file.read_bytes() == to_upload.read_bytes()
+    assert temp_file.read_bytes() == _SRC_BYTES
     with pytest.raises(DataError):
         client.download_to_file(temp_file, remote_file_id)
 
 
-def test_download_by_url(tmp_path: Path):
-    domain = "dfs.waketzheng.top"
-    client = FastdfsClient([domain])
+def test_download_by_url(client, tmp_path: Path):
     to_upload = Path(__file__)
     temp_file = tmp_path / "foo"
     with temp_remote_file(client, to_upload, as_url=True) as url:
         r = client.download_to_file(temp_file, url)
     assert r["Content"] == temp_file
-    assert temp_file.read_bytes() == to_upload.read_bytes()
+    assert temp_file.read_bytes() == _SRC_BYTES
     with pytest.raises(DataError):
         client.download_to_file(temp_file, url)